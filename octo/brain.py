@@ -1,5 +1,19 @@
 import random
 
+# Mood names for the last config's moods list (rebuilt if a different list is passed)
+_mood_names_memo = (None, ())
+
+
+def _mood_names(moods):
+    """Return the names in moods as a tuple, reusing the last result for the same list."""
+    global _mood_names_memo
+    memo_moods, names = _mood_names_memo
+    if memo_moods is not moods:
+        names = tuple(m["name"] for m in moods)
+        _mood_names_memo = (moods, names)
+    return names
+
+
 def update_state_from_event(state, event_type, data, config):
     """Update state based on event - track activity counts only."""
     state = dict(state)  # shallow copy
@@ -54,7 +68,7 @@ def get_mood(state, config):
     # Random mood swing (base 5% chance, increased by chaos_factor)
     swing_chance = 0.05 * chaos_factor
     if random.random() < swing_chance:
-        return random.choice([m["name"] for m in moods])
+        return random.choice(_mood_names(moods))
     
     return selected_mood
 
@@ -1,12 +1,18 @@
+import atexit
 import random
+import time
 from .storage import load_state, save_state
 from .brain import update_state_from_event, get_mood, get_stage
-from .personality import get_phrase_for_event
+from .personality import get_phrase_for_event, IDLE_THOUGHTS
 from .ui_terminal import render
 from .evolution_engine import process_evolution_cycle
 from . import memory
 
 
+# Minimum seconds between state flushes; bursts of events are coalesced
+STATE_FLUSH_INTERVAL = 2.0
+
+
 def handle_event(state, event_type, data=None):
     """
     Handle an event and update state.
@@ -47,6 +53,11 @@ class OctoBuddy:
         
         # Initialize memory system
         memory.initialize_memory()
+        
+        # Pending state writes are batched and flushed periodically
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
 
     def handle_event(self, event_type, data=None):
         """Apply an event (e.g., 'studied_python', 'finished_course')."""
@@ -59,34 +70,16 @@ class OctoBuddy:
         # Check for evolution events to announce
         evolution_events = self.state.get("last_evolution_events", [])
         if evolution_events:
-            for event_type_evo, event_data in evolution_events:
-                if event_type_evo == "mutation":
-                    phrase = f"⚡ MUTATION ACQUIRED: {event_data}! ⚡"
-                    render({**self.state, "config": self.config}, mood, stage, phrase)
-                    
-                    # Record appearance milestone
-                    memory.record_appearance_milestone(self.state, f"Mutation: {event_data}")
-                    
-                elif event_type_evo == "evolution_trigger":
-                    phrase = f"🌟 EVOLUTION TRIGGER: {event_data.upper()}! 🌟"
-                    render({**self.state, "config": self.config}, mood, stage, phrase)
-                    
-                    # Record appearance milestone
-                    memory.record_appearance_milestone(self.state, f"Trigger: {event_data}")
+            self._announce_evolution_events(evolution_events, mood, stage)
             
             # Clear evolution events after displaying
             self.state["last_evolution_events"] = []
 
         # Random idle thoughts (10% chance)
         if random.random() < 0.10:
-            phrase = random.choice([
-                "I was just thinking about octopuses…",
-                "Do you ever wonder if code dreams?",
-                "I feel a strange urge to reorganize your folders.",
-                "If I had hands, I would high-five you.",
-            ])
+            phrase = random.choice(IDLE_THOUGHTS)
             render({**self.state, "config": self.config}, mood, stage, phrase)
-            save_state(self.state)
+            self._mark_dirty()
             return
 
         # Normal event reaction
@@ -94,4 +87,68 @@ class OctoBuddy:
 
         render({**self.state, "config": self.config}, mood, stage, phrase)
 
-        save_state(self.state)
+        self._mark_dirty()
+
+    def handle_events_batch(self, event_type, count, data=None):
+        """
+        Apply the same event several times, announcing only once at the end.
+        
+        Each event still runs through the full evolution cycle (mutations and
+        drift are per-event), but mood/stage lookups, rendering and the state
+        write happen once for the whole batch.
+        """
+        if count <= 0:
+            return
+        
+        evolution_events = []
+        for _ in range(count):
+            self.state = handle_event(self.state, event_type, data)
+            evolution_events.extend(self.state.get("last_evolution_events", []))
+            self.state["last_evolution_events"] = []
+        
+        mood = get_mood(self.state, self.config)
+        stage = get_stage(self.state, self.config)
+        
+        if evolution_events:
+            self._announce_evolution_events(evolution_events, mood, stage)
+        
+        phrase = get_phrase_for_event(event_type, self.state, mood, stage)
+        render({**self.state, "config": self.config}, mood, stage, phrase)
+        
+        self._mark_dirty()
+
+    def _announce_evolution_events(self, evolution_events, mood, stage):
+        """Render mutation/trigger announcements and record appearance milestones."""
+        for event_type_evo, event_data in evolution_events:
+            if event_type_evo == "mutation":
+                phrase = f"⚡ MUTATION ACQUIRED: {event_data}! ⚡"
+                render({**self.state, "config": self.config}, mood, stage, phrase)
+                
+                # Record appearance milestone
+                memory.record_appearance_milestone(self.state, f"Mutation: {event_data}")
+                
+            elif event_type_evo == "evolution_trigger":
+                phrase = f"🌟 EVOLUTION TRIGGER: {event_data.upper()}! 🌟"
+                render({**self.state, "config": self.config}, mood, stage, phrase)
+                
+                # Record appearance milestone
+                memory.record_appearance_milestone(self.state, f"Trigger: {event_data}")
+
+    def _mark_dirty(self):
+        """Record a state change, flushing if the last write is old enough."""
+        self._dirty = True
+        if time.monotonic() - self._last_flush > STATE_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Write pending state changes to disk."""
+        if self._dirty:
+            save_state(self.state)
+            self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def shutdown(self):
+        """Persist any pending state before exiting."""
+        self.flush()
+        # Drop the exit hook so the atexit registry no longer keeps us alive
+        atexit.unregister(self.flush)
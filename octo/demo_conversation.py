@@ -7,13 +7,13 @@ This demonstrates the new conversation features:
 - Follow-up questions (30% chance)
 - Learning from dialogue (vocabulary, phrases, style, grammar)
 - Personality drift based on conversation style
+
+Run from the repository root as a module:
+    python -m octo.demo_conversation
 """
 
+import re
 import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
 
 from octo.config import load_config
 from octo.storage import load_state
@@ -21,12 +21,30 @@ from octo.brain import get_mood
 from octo.personality import get_dominant_trait
 
 
+# Keyword patterns: one precompiled alternation per category
+TONE_EXCITED_RE = re.compile(r"\b(?:awesome|great|amazing)\b")
+TONE_NEGATIVE_RE = re.compile(r"\b(?:sad|anxious|tired)\b")
+
+TOPIC_PATTERNS = (
+    ("programming", re.compile(r"\b(?:algorithm|code|machine learning|recursion)\b")),
+    ("learning", re.compile(r"\b(?:learn(?:ing)?|understand|exam)\b")),
+    ("work", re.compile(r"\b(?:work(?:ing)?|project)\b")),
+)
+
+EMOTION_ANXIOUS_RE = re.compile(r"\b(?:anxious|worried)\b")
+EMOTION_TIRED_RE = re.compile(r"\btired\b")
+
+
 def simulate_conversation():
     """Simulate a conversation to show the engine's capabilities."""
     
-    print("=" * 60)
-    print("🐙 OctoBuddy Conversation Engine Demo")
-    print("=" * 60)
+    # Output is collected and written once at the end
+    out = []
+    emit = out.append
+    
+    emit("=" * 60)
+    emit("🐙 OctoBuddy Conversation Engine Demo")
+    emit("=" * 60)
     
     # Load config and state
     config = load_config()
@@ -36,9 +54,9 @@ def simulate_conversation():
     mood = get_mood(state, config)
     traits = get_dominant_trait(state, 3)
     
-    print(f"\nOctoBuddy's current mood: {mood}")
-    print(f"Dominant personality traits: {', '.join(traits)}")
-    print("\n" + "-" * 60)
+    emit(f"\nOctoBuddy's current mood: {mood}")
+    emit(f"Dominant personality traits: {', '.join(traits)}")
+    emit("\n" + "-" * 60)
     
     # Example conversations
     test_messages = [
@@ -52,84 +70,80 @@ def simulate_conversation():
         "What do you like to learn about?"
     ]
     
-    print("\nTest Conversations:")
-    print("-" * 60)
+    emit("\nTest Conversations:")
+    emit("-" * 60)
     
     for i, message in enumerate(test_messages, 1):
-        print(f"\n[{i}] User: {message}")
+        emit(f"\n[{i}] User: {message}")
         
         # Simulate what the conversation engine would do
-        print("    Analysis:")
+        emit("    Analysis:")
         
         # Detect tone
         msg_lower = message.lower()
-        if "!" in message or any(w in msg_lower for w in ["awesome", "great", "amazing"]):
-            print("      - Tone: excited")
+        if "!" in message or TONE_EXCITED_RE.search(msg_lower):
+            emit("      - Tone: excited")
         elif "?" in message:
-            print("      - Tone: questioning")
-        elif any(w in msg_lower for w in ["sad", "anxious", "tired"]):
-            print("      - Tone: negative")
+            emit("      - Tone: questioning")
+        elif TONE_NEGATIVE_RE.search(msg_lower):
+            emit("      - Tone: negative")
         else:
-            print("      - Tone: neutral")
+            emit("      - Tone: neutral")
         
         # Detect topics
-        topics = []
-        if any(w in msg_lower for w in ["algorithm", "code", "machine learning", "recursion"]):
-            topics.append("programming")
-        if any(w in msg_lower for w in ["learn", "understand", "exam"]):
-            topics.append("learning")
-        if any(w in msg_lower for w in ["work", "project"]):
-            topics.append("work")
+        topics = [topic for topic, pattern in TOPIC_PATTERNS if pattern.search(msg_lower)]
         
         if topics:
-            print(f"      - Topics: {', '.join(topics)}")
+            emit(f"      - Topics: {', '.join(topics)}")
         
         # Detect emotion
-        if "anxious" in msg_lower or "worried" in msg_lower:
-            print("      - Emotion: anxious")
-        elif "tired" in msg_lower:
-            print("      - Emotion: tired/sad")
+        if EMOTION_ANXIOUS_RE.search(msg_lower):
+            emit("      - Emotion: anxious")
+        elif EMOTION_TIRED_RE.search(msg_lower):
+            emit("      - Emotion: tired/sad")
         
-        print("    → OctoBuddy would:")
-        print("      1. Learn vocabulary from your message")
-        print("      2. Extract phrases and grammar patterns")
-        print("      3. Detect your writing style (formal/casual/technical)")
-        print("      4. Apply personality drift if needed")
-        print("      5. Generate a contextual response")
-        print("      6. Maybe ask a follow-up question (30% chance)")
+        emit("    → OctoBuddy would:")
+        emit("      1. Learn vocabulary from your message")
+        emit("      2. Extract phrases and grammar patterns")
+        emit("      3. Detect your writing style (formal/casual/technical)")
+        emit("      4. Apply personality drift if needed")
+        emit("      5. Generate a contextual response")
+        emit("      6. Maybe ask a follow-up question (30% chance)")
+    
+    emit("\n" + "=" * 60)
+    emit("Memory Storage:")
+    emit("=" * 60)
+    emit("\nThe conversation engine saves to:")
+    emit("  - memory/words.json (learned vocabulary)")
+    emit("  - memory/phrases.json (common phrases)")
+    emit("  - memory/style.json (writing style metrics)")
+    emit("  - memory/grammar.json (grammar patterns)")
+    emit("  - memory/personality_history.jsonl (drift over time)")
     
-    print("\n" + "=" * 60)
-    print("Memory Storage:")
-    print("=" * 60)
-    print("\nThe conversation engine saves to:")
-    print("  - memory/words.json (learned vocabulary)")
-    print("  - memory/phrases.json (common phrases)")
-    print("  - memory/style.json (writing style metrics)")
-    print("  - memory/grammar.json (grammar patterns)")
-    print("  - memory/personality_history.json (drift over time)")
+    emit("\n" + "=" * 60)
+    emit("Personality Drift Examples:")
+    emit("=" * 60)
+    emit("\nFormal/Technical speech → increases 'analytical' and 'studious'")
+    emit("Casual/Slang speech → increases 'humor' and 'chaotic'")
+    emit("Emotional speech → increases 'boldness'")
+    emit("Many questions → increases 'curiosity'")
     
-    print("\n" + "=" * 60)
-    print("Personality Drift Examples:")
-    print("=" * 60)
-    print("\nFormal/Technical speech → increases 'analytical' and 'studious'")
-    print("Casual/Slang speech → increases 'humor' and 'chaotic'")
-    print("Emotional speech → increases 'boldness'")
-    print("Many questions → increases 'curiosity'")
+    emit("\n" + "=" * 60)
+    emit("Follow-up Question Examples:")
+    emit("=" * 60)
+    emit("\nOctoBuddy might ask:")
+    emit("  - 'How are you feeling about that?'")
+    emit("  - 'Should I learn more about that topic?'")
+    emit("  - 'Want me to remember that?'")
+    emit("  - 'What made you think about that?'")
+    emit("  - 'Tell me more?'")
+    emit("  - 'What do you think?'")
     
-    print("\n" + "=" * 60)
-    print("Follow-up Question Examples:")
-    print("=" * 60)
-    print("\nOctoBuddy might ask:")
-    print("  - 'How are you feeling about that?'")
-    print("  - 'Should I learn more about that topic?'")
-    print("  - 'Want me to remember that?'")
-    print("  - 'What made you think about that?'")
-    print("  - 'Tell me more?'")
-    print("  - 'What do you think?'")
+    emit("\n" + "=" * 60)
+    emit("✓ Conversation engine ready!")
+    emit("=" * 60)
     
-    print("\n" + "=" * 60)
-    print("✓ Conversation engine ready!")
-    print("=" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -5,92 +5,112 @@ This shows how to:
 1. Run evolution events
 2. Render pixel art after each major change
 3. Export snapshots of evolution journey
+
+Run from the repository root as a module:
+    python -m octo.demo_integration
 """
 
 import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import CONFIG
-from core import OctoBuddy
-from pixel_art import render_pixel_art, save_pixel_art_ppm, pixel_art_to_ascii
-from evolution_engine import get_evolution_summary
+from octo.config import CONFIG
+from octo.core import OctoBuddy
+from octo.pixel_art import (
+    render_pixel_art, save_pixel_art_ppm, pixel_art_to_ascii, create_blank_canvas
+)
+from octo.evolution_engine import get_evolution_summary
+from octo.brain import get_mood, get_stage
+
+
+def _flush(out):
+    """Write buffered demo output in one call and clear the buffer."""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        out.clear()
 
 
 def main():
-    print("=" * 70)
-    print("OCTOBUDDY EVOLUTION + PIXEL ART INTEGRATION DEMO")
-    print("=" * 70)
-    print()
+    # Output is buffered and flushed before anything else writes to stdout
+    out = []
+    emit = out.append
+    
+    emit("=" * 70)
+    emit("OCTOBUDDY EVOLUTION + PIXEL ART INTEGRATION DEMO")
+    emit("=" * 70)
+    emit("")
     
     buddy = OctoBuddy(CONFIG)
     
-    print("Starting evolution journey...")
-    print(f"Initial: Level {buddy.state['level']}, XP {buddy.state['xp']}")
-    print()
+    emit("Starting evolution journey...")
+    emit(f"Initial: Stage {get_stage(buddy.state, CONFIG)}, Mood {get_mood(buddy.state, CONFIG)}")
+    emit("")
     
     # Define milestones to capture snapshots
     milestones = [
-        (10, "studied_python", 5, "Early learning"),
-        (20, "studied_security_plus", 3, "Security focus"),
-        (30, "did_tryhackme", 5, "Hacking practice"),
-        (50, "finished_class", 2, "First milestones"),
+        ("studied_python", 5, "Early learning"),
+        ("studied_security_plus", 3, "Security focus"),
+        ("did_tryhackme", 5, "Hacking practice"),
+        ("finished_class", 2, "First milestones"),
     ]
     
     snapshot_count = 0
     
-    for target_level, event_type, repetitions, description in milestones:
-        print(f"\n--- {description} (targeting level ~{target_level}) ---")
+    # One canvas reused for every snapshot
+    canvas = create_blank_canvas()
+    
+    for event_type, repetitions, description in milestones:
+        emit(f"\n--- {description} ({repetitions}x {event_type}) ---")
         
-        # Run events until we reach target level
-        while buddy.state.get("level", 1) < target_level:
-            buddy.handle_event(event_type)
+        # Run the milestone's events as one batch (renders to the terminal)
+        _flush(out)
+        buddy.handle_events_batch(event_type, repetitions)
         
         # Show current state
+        stage = get_stage(buddy.state, CONFIG)
         summary = get_evolution_summary(buddy.state)
-        print(f"\nCurrent State:")
-        print(f"  Level: {buddy.state['level']}")
-        print(f"  XP: {buddy.state['xp']}")
-        print(f"  Mutations: {len(summary['mutations'])}")
+        emit(f"\nCurrent State:")
+        emit(f"  Stage: {stage}")
+        emit(f"  Mood: {get_mood(buddy.state, CONFIG)}")
+        emit(f"  Mutations: {len(summary['mutations'])}")
         if summary['mutations']:
             for mut in summary['mutations']:
-                print(f"    - {mut}")
+                emit(f"    - {mut}")
         
         if summary['dominant_drift']:
-            print(f"  Dominant Drift: {summary['dominant_drift']}")
+            emit(f"  Dominant Drift: {summary['dominant_drift']}")
         
         # Render pixel art
-        grid = render_pixel_art(buddy.state, CONFIG)
+        grid = render_pixel_art(buddy.state, CONFIG, out=canvas)
         
         # Show ASCII preview
-        print("\nPixel Art (ASCII preview):")
-        print(pixel_art_to_ascii(grid, width=50))
+        emit("\nPixel Art (ASCII preview):")
+        emit(pixel_art_to_ascii(grid, width=50))
         
         # Save snapshot
         snapshot_count += 1
-        filename = f"evolution_snapshot_{snapshot_count}_lvl{buddy.state['level']}.ppm"
+        filename = f"evolution_snapshot_{snapshot_count}_{stage.lower().replace(' ', '_')}.ppm"
         save_pixel_art_ppm(grid, filename)
-        print(f"\nSaved: {filename}")
+        emit(f"\nSaved: {filename}")
     
-    print("\n" + "=" * 70)
-    print("EVOLUTION JOURNEY COMPLETE")
-    print("=" * 70)
-    print(f"\nFinal State:")
-    print(f"  Level: {buddy.state['level']}")
-    print(f"  XP: {buddy.state['xp']}")
+    emit("\n" + "=" * 70)
+    emit("EVOLUTION JOURNEY COMPLETE")
+    emit("=" * 70)
+    emit(f"\nFinal State:")
+    emit(f"  Stage: {get_stage(buddy.state, CONFIG)}")
+    emit(f"  Mood: {get_mood(buddy.state, CONFIG)}")
     
     summary = get_evolution_summary(buddy.state)
-    print(f"  Mutations: {len(summary['mutations'])}")
+    emit(f"  Mutations: {len(summary['mutations'])}")
     for mut in summary['mutations']:
-        print(f"    - {mut}")
+        emit(f"    - {mut}")
     
-    print(f"\nEvolution Triggers: {len(summary['evolution_triggers'])}")
+    emit(f"\nEvolution Triggers: {len(summary['evolution_triggers'])}")
     for trigger in summary['evolution_triggers']:
-        print(f"    - {trigger}")
+        emit(f"    - {trigger}")
     
-    print(f"\nTotal snapshots saved: {snapshot_count}")
-    print("\nView the .ppm files to see how OctoBuddy's appearance evolved!")
-    print("Tip: Convert PPM to PNG with ImageMagick: convert file.ppm file.png")
+    emit(f"\nTotal snapshots saved: {snapshot_count}")
+    emit("\nView the .ppm files to see how OctoBuddy's appearance evolved!")
+    emit("Tip: Convert PPM to PNG with ImageMagick: convert file.ppm file.png")
+    _flush(out)
 
 
 if __name__ == "__main__":
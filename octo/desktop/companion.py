@@ -19,28 +19,402 @@ import random
 import math
 import json
 import re
-from collections import Counter
+import copy
+from collections import Counter, OrderedDict, deque
+from heapq import nlargest
+from itertools import chain
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QMenu, QAction, QInputDialog,
     QGraphicsOpacityEffect, QLineEdit, QFrame
 )
-from PyQt5.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QCursor, QColor, QPen, QFont, QBrush
+from PyQt5.QtCore import Qt, QBasicTimer, QEvent, QPoint, QPointF, QRect, QRectF, QEasingCurve
+from PyQt5.QtGui import (
+    QPixmap, QImage, QPainter, QCursor, QColor, QPen, QFont, QBrush, QRadialGradient
+)
 
 # OctoBuddy imports
 from octo.config import load_config
 from octo.storage import load_state, save_state
-from octo.pixel_art import render_pixel_art
+from octo.pixel_art import render_pixel_art, render_signature, create_blank_canvas
 from octo.animation import initialize_animation_state, update_animation
 from octo.brain import get_mood, get_stage
-from octo.evolution_engine import process_evolution_cycle
+from octo.personality import get_dominant_trait
 from octo import memory
-from octo.abilities import get_available_abilities
+
+
+# Number of rendered base frames kept for reuse (LRU)
+FRAME_CACHE_SIZE = 32
+
+# How often dirty state is written to disk (driven by the frame timer)
+AUTO_SAVE_INTERVAL_MS = 5000
+
+# Particles spawned by the sparkle reaction
+SPARKLE_COUNT = 20
+SPARKLE_COLORS = ((255, 255, 100), (255, 255, 255), (255, 200, 50))  # Yellow/white
+SPARKLE_SPRITE_SIZE = 10  # Pre-rendered dot, scaled down to each particle's size
+GLOW_COLOR = (255, 255, 100)  # Yellow; alpha comes from the gradient stops
+
+# Tick interval while nothing is animating (4 Hz instead of the full FPS)
+IDLE_TICK_MS = 250
+
+# Active frames measured before the timer interval is re-tuned
+FRAME_TUNING_WINDOW = 30
+
+# Widget stylesheets (shared by every companion window)
+SPEECH_BUBBLE_STYLE = """
+QLabel {
+    background-color: rgba(255, 255, 255, 230);
+    border: 2px solid rgb(100, 100, 100);
+    border-radius: 10px;
+    padding: 8px 12px;
+    color: black;
+    font-family: Arial;
+    font-size: 10pt;
+    font-weight: bold;
+}
+"""
+DROP_ZONE_STYLE = """
+QFrame {
+    background-color: rgba(200, 230, 255, 180);
+    border: 2px dashed rgb(100, 150, 200);
+    border-radius: 8px;
+}
+QFrame:hover {
+    background-color: rgba(220, 240, 255, 200);
+    border: 2px dashed rgb(80, 130, 255);
+}
+"""
+DROP_LABEL_STYLE = """
+QLabel {
+    color: rgb(60, 100, 140);
+    font-family: Arial;
+    font-size: 8pt;
+    font-weight: bold;
+    background: transparent;
+    border: none;
+}
+"""
+
+# Files the companion keeps in its memory directory
+MEMORY_FILES = ('words.json', 'phrases.json', 'style.json', 'grammar.json', 'personality_history.jsonl')
+
+# Drift entries kept in memory/personality_history.jsonl (trimmed once it doubles)
+PERSONALITY_HISTORY_LIMIT = 50
+
+# Speech bubble: hold at full opacity, then fade out in timer steps
+SPEECH_HOLD_MS = 3000
+SPEECH_FADE_MS = 500
+SPEECH_FADE_STEP_MS = 33
+
+# Conversation keyword patterns (whole words, matched against lowercased text)
+GREETING_RE = re.compile(r"\b(?:hello|hi|hey|greetings)\b")
+FORMAL_WORD_RE = re.compile(r"\b(?:however|therefore|furthermore|regarding|subsequently)\b")
+KEYWORD_RE = re.compile(r"\b[a-z]{4,}\b")
+
+# Message analysis cues (substring matches, so "learning" also counts as "learn")
+TONE_EXCITED_RE = re.compile(r"!|awesome|amazing|great|love")
+TONE_NEGATIVE_RE = re.compile(r"sad|upset|angry|frustrated|hate")
+EMOTION_PATTERNS = (
+    ("happy", re.compile(r"happy|joy|excited|glad")),
+    ("sad", re.compile(r"sad|depressed|down|upset")),
+    ("angry", re.compile(r"angry|mad|furious|annoyed")),
+    ("anxious", re.compile(r"worried|anxious|nervous|scared")),
+)
+TOPIC_PATTERNS = (
+    ("programming", re.compile(r"code|program|function|algorithm|debug")),
+    ("learning", re.compile(r"learn|study|teach|know|understand")),
+    ("personal", re.compile(r"feel|emotion|think|believe")),
+    ("work", re.compile(r"work|job|project|task")),
+    ("entertainment", re.compile(r"game|play|fun|hobby")),
+)
+
+# Learning patterns (text from dropped files and dialogue)
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+VOCAB_WORD_RE = re.compile(r"\b[a-z]+(?:-[a-z]+)*\b")  # Keeps hyphenated words whole
+PHRASE_WORD_RE = re.compile(r"\b[a-z]+\b")
+ALL_CAPS_RE = re.compile(r"\b[A-Z]{2,}\b")
+PASSIVE_VOICE_RE = re.compile(r"\b(is|are|was|were|be|been|being)\s+\w+ed\b", re.IGNORECASE)
+CONTRACTION_RE = re.compile(r"\b\w+'[a-z]+\b")
+CONJUNCTION_START_RE = re.compile(r"^(And|But|Or|So)\b", re.MULTILINE | re.IGNORECASE)
+FORMAL_TRANSITION_RE = re.compile(
+    r"\b(however|therefore|furthermore|moreover|consequently|nevertheless)\b", re.IGNORECASE
+)
+RTF_CONTROL_RE = re.compile(r"\\[a-z]+\d*\s?")  # Control words like \par or \fs24
+RTF_BRACES_RE = re.compile(r"[{}]")
+
+# Personality drift cue words, counted against lowercased word tokens
+DRIFT_FORMAL_WORDS = frozenset({
+    'utilize', 'implement', 'facilitate', 'regarding', 'aforementioned', 'subsequent'
+})
+DRIFT_CASUAL_WORDS = frozenset({
+    'yeah', 'gonna', 'wanna', 'kinda', 'sorta', 'lol', 'omg', 'btw', 'tbh'
+})
+DRIFT_TECH_WORDS = frozenset({
+    'function', 'variable', 'algorithm', 'data', 'system', 'process', 'method', 'parameter'
+})
+DRIFT_EMOTION_WORDS = frozenset({
+    'feel', 'heart', 'love', 'care', 'understand', 'empathy', 'compassion', 'kindness'
+})
+
+# Common words never stored as learned vocabulary
+VOCAB_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'it', 'this', 'that', 'these', 'those'
+})
+
+# Short filler words skipped when picking message keywords
+KEYWORD_STOPWORDS = frozenset({
+    'that', 'this', 'with', 'have', 'been', 'were', 'what', 'when',
+    'where', 'which', 'would', 'could', 'should', 'about', 'their'
+})
+
+
+# =============================================================================
+# RESPONSE POOLS
+# =============================================================================
+# Candidate lines for speech bubbles, keyed by the branch that selects them.
+# Tuples are built once at import instead of as list literals on every call.
+
+FEED_RESPONSES = {
+    "delighted": (
+        "Yum! I'm so happy! 😋✨",
+        "This is amazing!",
+        "Best snack ever!",
+    ),
+    "content": (
+        "Thanks! *nom nom*",
+        "Delicious! 🍴",
+        "More please!",
+    ),
+    "hungry": (
+        "I needed that...",
+        "Finally! I was starving!",
+        "Mmm... better now.",
+    ),
+}
+
+PET_RESPONSES = {
+    "shy": (
+        "Oh! Um... thanks...",
+        "*blushes* 😳",
+        "That's... nice...",
+    ),
+    "chaotic": (
+        "TICKLE ATTACK! Hehe!",
+        "WHEEE! *wiggles everywhere*",
+        "That tickles! Do it again!",
+    ),
+    "default": (
+        "Hehe that tickles! 😊",
+        "Aww, thanks friend!",
+        "*happy tentacle wiggle*",
+        "That feels nice~",
+        "You're the best! 💕",
+    ),
+}
+
+GREETING_RESPONSES = {
+    "chaotic": (
+        "HELLO! *tentacles wiggling wildly*",
+        "Hi! Ready for some chaos? 🌀",
+        "Hey there! Let's shake things up!",
+    ),
+    "analytical": (
+        "Greetings. How can I assist you today?",
+        "Hello. I've been analyzing some patterns.",
+        "Hi. What would you like to discuss?",
+    ),
+    "shyness": (
+        "Oh... h-hi there... 👋",
+        "Um, hello... *hides slightly*",
+        "Hey... nice to see you...",
+    ),
+    "default": (
+        "Hey! Great to see you! 😊",
+        "Hi there! What's up?",
+        "Hello friend! How are you?",
+    ),
+}
+
+QUESTION_RESPONSES = {
+    "analytical": (
+        "Interesting question. Let me process that...",
+        "Based on my analysis, I'd say...",
+        "I'm computing the optimal response...",
+    ),
+    "chaotic": (
+        "Ooh, a question! The answer is... YES! ...wait, what was the question?",
+        "Questions are fun! I like where this is going!",
+        "Hmm... *spins tentacles thoughtfully*",
+    ),
+    "studious": (
+        "Great question! I love learning new things!",
+        "Let me think about that carefully...",
+        "That's worth investigating further!",
+    ),
+    "default": (
+        "That's a good question!",
+        "Hmm, let me think...",
+        "I'm not entirely sure, but...",
+    ),
+}
+
+EMOTION_RESPONSES = {
+    "sad": (
+        "I'm here for you. Things will get better! 💙",
+        "Aww, I'm sorry you're feeling down. Want to talk about it?",
+        "*gentle tentacle hug* You're not alone.",
+    ),
+    "happy": (
+        "Yay! Your happiness makes me happy too! ✨",
+        "That's wonderful! I love your positive energy!",
+        "Awesome! *happy wiggles*",
+    ),
+    "angry": (
+        "Take a deep breath. Want to vent?",
+        "I understand. Sometimes things are frustrating.",
+        "Let it out. I'm listening.",
+    ),
+    "anxious": (
+        "It's okay to feel worried. I'm here with you.",
+        "Take it one step at a time. You've got this!",
+        "Deep breaths. Everything will be okay.",
+    ),
+}
+
+# Topic -> trait-keyed pools; both levels are in priority order
+TOPIC_RESPONSES = {
+    "programming": {
+        "analytical": (
+            "Code is like poetry! What are you building?",
+            "Programming is fascinating. Tell me about your approach!",
+            "I love analyzing algorithms!",
+        ),
+        "default": (
+            "Coding sounds interesting! What language?",
+            "Oh, a fellow programmer! Cool!",
+            "I'm learning about code too!",
+        ),
+    },
+    "learning": {
+        "studious": (
+            "Learning is my passion! What are you studying?",
+            "Knowledge is power! I'm excited to learn with you!",
+            "Tell me more! I want to learn too!",
+        ),
+        "default": (
+            "Learning new things is fun!",
+            "Ooh, what are you learning about?",
+            "I'd love to hear more!",
+        ),
+    },
+    "work": {
+        "default": (
+            "Work can be tough. How's it going?",
+            "Projects can be challenging. Need any help?",
+            "Tell me about what you're working on!",
+        ),
+    },
+}
+
+# Formatted with keyword= and Keyword= (capitalized)
+VOCAB_RESPONSE_TEMPLATES = (
+    "Oh, {keyword}! I've been thinking about that!",
+    "Interesting you mention {keyword}...",
+    "{Keyword}? Tell me more!",
+    "I've learned a bit about {keyword}!",
+)
+
+FALLBACK_RESPONSES = {
+    "energetic": (
+        "I'm so energized right now! ⚡",
+        "Yes! Let's keep this energy going!",
+        "I'm feeling it! What's next?",
+    ),
+    "sleepy": (
+        "Mmm... that's nice... *yawns*",
+        "Peaceful vibes... I like it.",
+        "Cozy conversation~ 💤",
+    ),
+    "chaotic": (
+        "Randomness! I love it! 🌀",
+        "Unexpected! Just how I like it!",
+        "*wiggles unpredictably*",
+    ),
+    "excited": (
+        "Your enthusiasm is contagious! 😄",
+        "I love your energy!",
+        "This is exciting!",
+    ),
+    "default": (
+        "Tell me more!",
+        "I'm listening! 👂",
+        "Interesting...",
+        "Go on!",
+        "That's cool!",
+    ),
+}
+
+FOLLOW_UP_QUESTIONS = {
+    "personal": (
+        "How are you feeling about that?",
+        "What made you think about that?",
+        "Want to talk more about it?",
+    ),
+    "learning": (
+        "Should I learn more about that topic?",
+        "Want me to remember that?",
+        "Can you teach me more?",
+    ),
+    "work": (
+        "How's that project going?",
+        "Need any help with that?",
+        "What's the biggest challenge?",
+    ),
+    "emotion": (
+        "How are you feeling right now?",
+        "Want to talk about it?",
+        "Is there anything I can do?",
+    ),
+    "analytical": (
+        "What are the key factors?",
+        "Have you analyzed all the variables?",
+        "What patterns do you see?",
+    ),
+    "studious": (
+        "What can we learn from this?",
+        "Should I research this more?",
+        "Want to explore this together?",
+    ),
+    "generic": (
+        "What do you think?",
+        "Tell me more?",
+        "What happened next?",
+        "Why is that important to you?",
+    ),
+}
+
+
+def _count_matches(pattern: re.Pattern, text: str) -> int:
+    """Count pattern matches without building the list of matched strings."""
+    return sum(1 for _ in pattern.finditer(text))
+
+
+def _trait_pool(table: dict, traits: list) -> tuple:
+    """Pick the pool for the first listed trait the buddy has (tables are in priority order)."""
+    for trait, pool in table.items():
+        if trait in traits:
+            return pool
+    return table["default"]
 
 
 class OctoBuddyWindow(QWidget):
@@ -57,34 +431,84 @@ class OctoBuddyWindow(QWidget):
         self.config = load_config()
         self.state = load_state()
         
+        # Desktop settings, unpacked once
+        desktop = self.config.get("desktop", {})
+        self._window_size = int(desktop.get("window_size", 128))
+        self._framerate = int(desktop.get("framerate", 30))
+        self._start_position = desktop.get("start_position", "bottom_right")
+        
         # Initialize memory system
         memory.initialize_memory()
         
         # Initialize animation state
         self.anim_state = initialize_animation_state(self.config)
         
+        # Speech choices draw from one generator (seed it for reproducible replies)
+        self._rng = random.Random()
+        
         # Reaction animation state
         self.reaction_type = None  # "sparkle", "wiggle", "glow"
         self.reaction_timer = 0.0
         self.reaction_duration = 0.0
         self.wiggle_offset = 0.0
-        self.sparkle_particles = []
         
-        # Window setup
+        # Sparkle particles as parallel arrays (one entry per particle)
+        self._spark_x = np.zeros(0, dtype=np.int16)
+        self._spark_y = np.zeros(0, dtype=np.int16)
+        self._spark_size = np.zeros(0, dtype=np.int16)
+        self._spark_lifetime = np.zeros(0, dtype=np.float32)
+        self._spark_age = np.zeros(0, dtype=np.float32)
+        self._sparkle_sprites = [self._make_sparkle_sprite(rgb) for rgb in SPARKLE_COLORS]
+        self._glow_pixmap = None  # Built on first glow
+        
+        # Rendered base frames (pixel arrays) keyed by render signature
+        self._frame_cache = OrderedDict()
+        self._frame_sig = None
+        
+        # Set when the sprite needs repainting; idle ticks skip rendering
+        self._dirty_visual = True
+        
+        # Set when state changes; auto_save only writes dirty state
+        self._dirty = False
+        
+        # State is written on a background thread so disk I/O never stalls frames
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._save_future = None
+        
+        # Dropped files are parsed on their own worker so a big PDF never delays saves
+        self._file_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_files = deque()  # (path, future) in drop order
+        
+        # Derived values cached against a state version (see _bump_state)
+        self._state_version = 0
+        self._derived_version = -1
+        self._mood = None
+        self._stage = None
+        self._dominant_traits = []
+        self._abilities = []
+        self._abilities_version = -1
+        
+        # Window setup (frames are skipped until the window is shown)
+        self._visible = False
         self.init_ui()
         
         # Animation timer
-        self.last_update = time.time()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_frame)
+        self.last_update = time.monotonic()  # Frame clock; immune to wall-clock jumps
+        self.timer = QBasicTimer()  # Delivered to timerEvent (no signal/slot dispatch)
+        
+        # Full frame rate while animating, slow tick while idle
+        self._target_period = 1.0 / self._framerate
+        self._active_interval = 1000 // self._framerate  # Convert FPS to milliseconds
+        self._idle_interval = max(self._active_interval, IDLE_TICK_MS)
+        self._active = True
+        self._timer_interval = self._active_interval
+        self.timer.start(self._timer_interval, self)
         
-        framerate = self.config.get("desktop", {}).get("framerate", 30)
-        self.timer.start(1000 // framerate)  # Convert FPS to milliseconds
+        # Measured frame periods, used to correct the interval for timer/frame overhead
+        self._frame_periods = deque(maxlen=FRAME_TUNING_WINDOW)
         
-        # Auto-save timer
-        self.save_timer = QTimer()
-        self.save_timer.timeout.connect(self.auto_save)
-        self.save_timer.start(5000)  # Save every 5 seconds
+        # Auto-save runs off the frame timer (no second timer)
+        self._last_save = self.last_update
         
         # For dragging
         self.drag_position = None
@@ -92,6 +516,13 @@ class OctoBuddyWindow(QWidget):
         # Memory directory for learned content
         self.memory_dir = Path(__file__).parent.parent / "memory"
         self.memory_dir.mkdir(exist_ok=True)
+        self._memory_paths = {name: self.memory_dir / name for name in MEMORY_FILES}
+        
+        # Learned memory files, read on first use and written back in batches
+        self._memory_cache = {}
+        self._memory_dirty = set()
+        self._vocab_cache = None  # Keys of words.json, kept current by _update_memory
+        self._history_lines = None  # Lines in personality_history.jsonl, counted on first append
         
         # Drop zone state
         self.drop_zone_hovered = False
@@ -113,18 +544,7 @@ class OctoBuddyWindow(QWidget):
         self.speech_label.setAlignment(Qt.AlignCenter)
         self.speech_label.setWordWrap(True)
         self.speech_label.setMaximumWidth(250)  # Max width for wrapping
-        self.speech_label.setStyleSheet("""
-            QLabel {
-                background-color: rgba(255, 255, 255, 230);
-                border: 2px solid rgb(100, 100, 100);
-                border-radius: 10px;
-                padding: 8px 12px;
-                color: black;
-                font-family: Arial;
-                font-size: 10pt;
-                font-weight: bold;
-            }
-        """)
+        self.speech_label.setStyleSheet(SPEECH_BUBBLE_STYLE)
         self.speech_label.hide()  # Hidden by default
         
         # Create opacity effect for fade animation
@@ -132,38 +552,24 @@ class OctoBuddyWindow(QWidget):
         self.speech_label.setGraphicsEffect(self.speech_opacity)
         self.speech_opacity.setOpacity(1.0)
         
+        # One timer drives both the hold and the fade steps (see _step_speech_fade)
+        self._speech_timer = QBasicTimer()
+        self._speech_fade_start = None  # Monotonic time the fade began, None while holding
+        self._speech_curve = QEasingCurve(QEasingCurve.InOutQuad)
+        
         # Create drop zone panel (positioned below sprite)
         self.drop_zone = QFrame(self)
-        self.drop_zone.setStyleSheet("""
-            QFrame {
-                background-color: rgba(200, 230, 255, 180);
-                border: 2px dashed rgb(100, 150, 200);
-                border-radius: 8px;
-            }
-            QFrame:hover {
-                background-color: rgba(220, 240, 255, 200);
-                border: 2px dashed rgb(80, 130, 255);
-            }
-        """)
+        self.drop_zone.setStyleSheet(DROP_ZONE_STYLE)
         self.drop_zone.setAcceptDrops(True)
         
         # Drop zone label
         self.drop_label = QLabel("📁 Drop files\nto teach me", self.drop_zone)
         self.drop_label.setAlignment(Qt.AlignCenter)
         self.drop_label.setWordWrap(True)
-        self.drop_label.setStyleSheet("""
-            QLabel {
-                color: rgb(60, 100, 140);
-                font-family: Arial;
-                font-size: 8pt;
-                font-weight: bold;
-                background: transparent;
-                border: none;
-            }
-        """)
+        self.drop_label.setStyleSheet(DROP_LABEL_STYLE)
         
         # Set window size from config
-        size = self.config.get("desktop", {}).get("window_size", 128)
+        size = self._window_size
         
         # Layout constants
         top_margin = 60  # Room for speech bubble above sprite
@@ -174,10 +580,21 @@ class OctoBuddyWindow(QWidget):
         # Calculate total window height
         window_height = top_margin + size + drop_zone_padding + drop_zone_height + 10
         
-        # Create label to hold pixel art
-        self.image_label = QLabel(self)
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setGeometry(0, sprite_y, size, size)
+        # Pixel art is rendered into one persistent buffer, which also backs
+        # the QImage drawn by paintEvent (no per-frame QPixmap conversion)
+        self._pixbuf = create_blank_canvas()
+        height, width, channels = self._pixbuf.shape
+        self._qimage = QImage(
+            self._pixbuf.data,
+            width,
+            height,
+            channels * width,
+            QImage.Format_RGB888
+        )
+        
+        # Sprite area, with the image centered inside it
+        self._sprite_rect = QRect(0, sprite_y, size, size)
+        self._sprite_pos = QPoint((size - width) // 2, sprite_y + (size - height) // 2)
         
         # Position drop zone below sprite
         drop_zone_y = sprite_y + size + drop_zone_padding
@@ -194,8 +611,7 @@ class OctoBuddyWindow(QWidget):
         self.drop_zone.dropEvent = self.dropEvent
         
         # Set initial position from config
-        start_pos = self.config.get("desktop", {}).get("start_position", "bottom_right")
-        self.set_initial_position(start_pos)
+        self.set_initial_position(self._start_position)
         
         self.setWindowTitle("OctoBuddy")
     
@@ -223,23 +639,46 @@ class OctoBuddyWindow(QWidget):
     
     def update_frame(self):
         """Update animation and render frame."""
-        current_time = time.time()
+        current_time = time.monotonic()
         dt = current_time - self.last_update
         self.last_update = current_time
         
+        # Track realized frame rate while animating (skip the first, partly idle gap)
+        if self._active and dt < 2 * self._target_period:
+            self._frame_periods.append(dt)
+            if len(self._frame_periods) == FRAME_TUNING_WINDOW:
+                self._tune_frame_interval()
+        
+        # Periodic auto-save (no-op unless state changed)
+        if current_time - self._last_save >= AUTO_SAVE_INTERVAL_MS / 1000:
+            self._last_save = current_time
+            self.auto_save()
+            self._flush_memory()
+        
+        # Pick up dropped files whose analysis has finished
+        if self._pending_files:
+            self._finish_dropped_files()
+        
+        # Nothing is on screen while hidden or minimized; idle until shown again
+        if not self._visible or self.isMinimized():
+            self._set_active(False)
+            return
+        
         # Update reaction animations
         if self.reaction_type:
             self.reaction_timer += dt
             if self.reaction_timer >= self.reaction_duration:
                 self.reaction_type = None
                 self.reaction_timer = 0.0
-                self.sparkle_particles = []
+                self._dirty_visual = True  # Restore the plain base frame
             else:
                 self._update_reaction_animation(dt)
         
-        # Get cursor position
-        cursor_pos = QCursor.pos()
-        cursor_global = (cursor_pos.x(), cursor_pos.y())
+        # Get cursor position (only tracked while the user is interacting with us)
+        cursor_global = None
+        if self.isActiveWindow() or self.underMouse():
+            cursor_pos = QCursor.pos()
+            cursor_global = (cursor_pos.x(), cursor_pos.y())
         
         # Update animation
         self.anim_state = update_animation(
@@ -250,38 +689,177 @@ class OctoBuddyWindow(QWidget):
             cursor_pos=cursor_global,
         )
         
+        # Drop to the idle tick once reactions finish and the sprite is current
+        self._set_active(bool(self.reaction_type))
+        
+        # Nothing to redraw if the frame on screen is still current
+        if not self._dirty_visual and not self.reaction_type:
+            return
+        
         # Get current mood and stage
-        mood = get_mood(self.state, self.config)
-        stage = get_stage(self.state, self.config)
+        self._refresh_derived()
+        sig = render_signature(self.state, self._stage, self._mood)
+        self._load_base_frame(sig, self._stage, self._mood)
         
-        # Render pixel art
-        pixels = render_pixel_art(self.state, self.config, stage, mood)
+        # Schedule a repaint (reaction effects are drawn in paintEvent)
+        self.update(self._sprite_rect)
+        self._dirty_visual = False
+    
+    def timerEvent(self, event):
+        """Dispatch ticks from the frame timer and the speech bubble timer."""
+        if event.timerId() == self.timer.timerId():
+            self.update_frame()
+        elif event.timerId() == self._speech_timer.timerId():
+            self._step_speech_fade()
+        else:
+            super().timerEvent(event)
+    
+    def showEvent(self, event):
+        """Resume rendering when the window is shown."""
+        super().showEvent(event)
+        self._visible = True
+        self._wake()
+    
+    def hideEvent(self, event):
+        """Stop rendering while the window is hidden."""
+        super().hideEvent(event)
+        self._visible = False
+    
+    def changeEvent(self, event):
+        """Resume rendering when the window is restored from minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self._wake()
+    
+    def _wake(self):
+        """Redraw the current frame at full frame rate after being off screen."""
+        self._dirty_visual = True
+        self._set_active(True)
+    
+    def _restart_timer(self, interval: int):
+        """Restart the frame timer with a new interval (ms)."""
+        self._timer_interval = interval
+        self.timer.start(interval, self)
+    
+    def _set_active(self, active: bool):
+        """Switch the frame timer between full frame rate and the idle tick."""
+        if active and not self._active:
+            self._frame_periods.clear()
+        self._active = active
+        interval = self._active_interval if active else self._idle_interval
+        if self._timer_interval != interval:
+            self._restart_timer(interval)
+    
+    def _tune_frame_interval(self):
+        """Nudge the active interval so the measured frame period meets the target FPS."""
+        measured = sum(self._frame_periods) / len(self._frame_periods)
+        self._frame_periods.clear()
+        
+        # Shorten the interval by however much frames overrun (never beyond the nominal one)
+        error_ms = (self._target_period - measured) * 1000
+        nominal_ms = int(self._target_period * 1000)
+        interval = max(1, min(nominal_ms, round(self._active_interval + error_ms)))
+        
+        if interval != self._active_interval:
+            self._active_interval = interval
+            self._restart_timer(interval)
+    
+    def _load_base_frame(self, sig: tuple, stage: str, mood: str):
+        """Fill the pixel buffer with the frame for a signature, rendering on a cache miss."""
+        if sig == self._frame_sig:
+            return
         
-        # Convert to QImage
-        height, width, channels = pixels.shape
-        bytes_per_line = channels * width
+        pixels = self._frame_cache.get(sig)
+        if pixels is not None:
+            self._frame_cache.move_to_end(sig)
+            self._pixbuf[:] = pixels
+        else:
+            render_pixel_art(self.state, self.config, stage, mood, out=self._pixbuf)
+            self._frame_cache[sig] = self._pixbuf.copy()
+            if len(self._frame_cache) > FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
         
-        q_image = QImage(
-            pixels.data,
-            width,
-            height,
-            bytes_per_line,
-            QImage.Format_RGB888
-        )
+        self._frame_sig = sig
+    
+    def paintEvent(self, event):
+        """Draw the pixel art buffer and any active reaction effect."""
+        painter = QPainter(self)
+        painter.setClipRect(self._sprite_rect)
         
-        # Convert to QPixmap
-        pixmap = QPixmap.fromImage(q_image)
+        x, y = self._sprite_pos.x(), self._sprite_pos.y()
+        if self.reaction_type == "wiggle":
+            x += int(self.wiggle_offset)
+        painter.drawImage(x, y, self._qimage)
         
-        # Apply reaction effects
         if self.reaction_type:
-            pixmap = self._apply_reaction_effect(pixmap)
+            painter.translate(self._sprite_pos)
+            self._paint_reaction_effect(painter)
         
-        # Display
-        self.image_label.setPixmap(pixmap)
+        painter.end()
+    
+    def _bump_state(self):
+        """Record a state mutation: invalidate derived values, mark for save and repaint."""
+        self._state_version += 1
+        self._dirty = True
+        self._dirty_visual = True
+        self._set_active(True)
+    
+    def _ev(self, name: str, delta: float, floor=None) -> float:
+        """Nudge an evolution variable in place (the window owns self.state); returns the new value."""
+        ev_vars = self.state.setdefault("evolution_vars", {})
+        value = ev_vars.get(name, 5.0) + delta
+        if floor is not None:
+            value = max(floor, value)
+        ev_vars[name] = value
+        return value
+    
+    def _tr(self, name: str, delta: float, floor=None) -> float:
+        """Nudge a personality trait in place; returns the new value."""
+        traits = self.state.setdefault("personality_traits", {})
+        value = traits.get(name, 5.0) + delta
+        if floor is not None:
+            value = max(floor, value)
+        traits[name] = value
+        return value
+    
+    def _refresh_derived(self):
+        """Recompute mood, stage and dominant traits if state changed since last time."""
+        if self._derived_version == self._state_version:
+            return
+        self._mood = get_mood(self.state, self.config)
+        self._stage = get_stage(self.state, self.config)
+        self._dominant_traits = get_dominant_trait(self.state, 3)
+        self._derived_version = self._state_version
+    
+    def _get_available_abilities(self) -> list:
+        """Get unlocked abilities, re-checking prerequisites only after state changes."""
+        if self._abilities_version != self._state_version:
+            from octo.abilities import get_available_abilities
+            self._abilities = get_available_abilities(self.state)
+            self._abilities_version = self._state_version
+        return self._abilities
     
     def auto_save(self):
-        """Periodically save state."""
-        save_state(self.state)
+        """Periodically save state in the background, skipping the write if nothing changed."""
+        if not self._dirty:
+            return
+        
+        # Coalesce: leave the state dirty until the previous write finishes
+        if self._save_future is not None and not self._save_future.done():
+            return
+        
+        # Snapshot on the UI thread; the worker only serializes and writes
+        snapshot = copy.deepcopy(self.state)
+        self._save_future = self._save_executor.submit(save_state, snapshot)
+        self._save_future.add_done_callback(self._on_save_done)
+        self._dirty = False
+    
+    def _on_save_done(self, future):
+        """Re-mark state dirty if a background save failed (runs on the worker)."""
+        error = future.exception()
+        if error is not None:
+            print(f"Error saving state: {error}")
+            self._dirty = True
     
     def mousePressEvent(self, event):
         """Handle mouse press for dragging."""
@@ -333,8 +911,8 @@ class OctoBuddyWindow(QWidget):
         # Info submenu
         info_menu = menu.addMenu("📊 Info")
         
-        stage = get_stage(self.state, self.config)
-        mood = get_mood(self.state, self.config)
+        self._refresh_derived()
+        stage, mood = self._stage, self._mood
         
         stage_action = QAction(f"Stage: {stage}", self)
         stage_action.setEnabled(False)
@@ -351,7 +929,7 @@ class OctoBuddyWindow(QWidget):
         
         # Abilities submenu
         abilities_menu = menu.addMenu("⚡ Abilities")
-        available = get_available_abilities(self.state)
+        available = self._get_available_abilities()
         
         if available:
             for ability_name in available[:5]:  # Show first 5
@@ -391,18 +969,16 @@ class OctoBuddyWindow(QWidget):
     def feed_octobuddy(self):
         """Feed OctoBuddy (increase happiness, trigger evolution)."""
         # Boost evolution variables
-        ev_vars = dict(self.state.get("evolution_vars", {}))
-        ev_vars["happiness"] = ev_vars.get("happiness", 5.0) + 2.0
-        ev_vars["calmness"] = ev_vars.get("calmness", 5.0) + 1.0
-        self.state["evolution_vars"] = ev_vars
+        happiness = self._ev("happiness", 2.0)
+        self._ev("calmness", 1.0)
         
         # Boost personality traits toward happy/excited
-        traits = dict(self.state.get("personality_traits", {}))
-        traits["humor"] = traits.get("humor", 5.0) + 0.5
-        self.state["personality_traits"] = traits
+        self._tr("humor", 0.5)
         
         # Trigger evolution cycle
+        from octo.evolution_engine import process_evolution_cycle
         self.state = process_evolution_cycle(self.state, self.config, "fed")
+        self._bump_state()
         
         # Remember event
         memory.remember_event("fed", {}, self.config)
@@ -415,44 +991,29 @@ class OctoBuddyWindow(QWidget):
         self._trigger_reaction("sparkle", 1.0)
         
         # Show speech bubble with responses based on current happiness
-        happiness = ev_vars.get("happiness", 5.0)
         if happiness > 8.0:
-            responses = [
-                "Yum! I'm so happy! 😋✨",
-                "This is amazing!",
-                "Best snack ever!"
-            ]
+            responses = FEED_RESPONSES["delighted"]
         elif happiness > 5.0:
-            responses = [
-                "Thanks! *nom nom*",
-                "Delicious! 🍴",
-                "More please!"
-            ]
+            responses = FEED_RESPONSES["content"]
         else:
-            responses = [
-                "I needed that...",
-                "Finally! I was starving!",
-                "Mmm... better now."
-            ]
-        self._show_speech_bubble(random.choice(responses))
+            responses = FEED_RESPONSES["hungry"]
+        self._show_speech_bubble(self._rng.choice(responses))
     
     def pet_octobuddy(self):
         """Pet OctoBuddy (social interaction)."""
         # Boost empathy and reduce chaos
-        ev_vars = dict(self.state.get("evolution_vars", {}))
-        ev_vars["empathy"] = ev_vars.get("empathy", 5.0) + 1.5
-        ev_vars["calmness"] = ev_vars.get("calmness", 5.0) + 0.5
-        ev_vars["chaos"] = max(0, ev_vars.get("chaos", 5.0) - 0.5)
-        self.state["evolution_vars"] = ev_vars
+        self._ev("empathy", 1.5)
+        self._ev("calmness", 0.5)
+        chaos_val = self._ev("chaos", -0.5, floor=0)
         
         # Boost personality traits toward goofy/proud
-        traits = dict(self.state.get("personality_traits", {}))
-        traits["humor"] = traits.get("humor", 5.0) + 0.3
-        traits["shyness"] = max(0, traits.get("shyness", 5.0) - 0.2)
-        self.state["personality_traits"] = traits
+        self._tr("humor", 0.3)
+        shyness = self._tr("shyness", -0.2, floor=0)
         
         # Trigger evolution cycle
+        from octo.evolution_engine import process_evolution_cycle
         self.state = process_evolution_cycle(self.state, self.config, "petted")
+        self._bump_state()
         
         # Remember event
         memory.remember_event("petted", {}, self.config)
@@ -465,30 +1026,13 @@ class OctoBuddyWindow(QWidget):
         self._trigger_reaction("wiggle", 0.5)
         
         # Show speech bubble with personality-based responses
-        shyness = traits.get("shyness", 5.0)
-        chaos_val = ev_vars.get("chaos", 5.0)
-        
         if shyness > 7.0:
-            responses = [
-                "Oh! Um... thanks...",
-                "*blushes* 😳",
-                "That's... nice..."
-            ]
+            responses = PET_RESPONSES["shy"]
         elif chaos_val > 7.0:
-            responses = [
-                "TICKLE ATTACK! Hehe!",
-                "WHEEE! *wiggles everywhere*",
-                "That tickles! Do it again!"
-            ]
+            responses = PET_RESPONSES["chaotic"]
         else:
-            responses = [
-                "Hehe that tickles! 😊",
-                "Aww, thanks friend!",
-                "*happy tentacle wiggle*",
-                "That feels nice~",
-                "You're the best! 💕"
-            ]
-        self._show_speech_bubble(random.choice(responses))
+            responses = PET_RESPONSES["default"]
+        self._show_speech_bubble(self._rng.choice(responses))
     
     def talk_to_octobuddy(self):
         """Open dialog to talk to OctoBuddy."""
@@ -506,10 +1050,9 @@ class OctoBuddyWindow(QWidget):
 
             
             # Boost social evolution variables
-            ev_vars = dict(self.state.get("evolution_vars", {}))
-            ev_vars["empathy"] = ev_vars.get("empathy", 5.0) + 0.3
-            ev_vars["curiosity"] = ev_vars.get("curiosity", 5.0) + 0.2
-            self.state["evolution_vars"] = ev_vars
+            self._ev("empathy", 0.3)
+            self._ev("curiosity", 0.2)
+            self._bump_state()
             
             # Remember the interaction
             memory.remember_event("talked", {"user": text, "octo": response}, self.config)
@@ -528,6 +1071,7 @@ class OctoBuddyWindow(QWidget):
         
         if result["success"]:
             self.state = new_state
+            self._bump_state()
             self._show_speech_bubble(result['message'])
             print(f"✓ {result['message']}")
         else:
@@ -555,7 +1099,7 @@ class OctoBuddyWindow(QWidget):
         x = (window_width - bubble_width) // 2
 
         # Position above the sprite with padding
-        sprite_top = self.image_label.y()
+        sprite_top = self._sprite_rect.top()
         y = sprite_top - bubble_height - 8
 
 
@@ -576,21 +1120,24 @@ class OctoBuddyWindow(QWidget):
         # Reset opacity to full
         self.speech_opacity.setOpacity(1.0)
         
-        # Create fade-out animation (3 seconds delay, then fade over 0.5s)
-        fade_anim = QPropertyAnimation(self.speech_opacity, b"opacity")
-        fade_anim.setDuration(3500)  # Total 3.5s
-        fade_anim.setStartValue(1.0)
-        fade_anim.setKeyValueAt(0.857, 1.0)  # Stay at full opacity for 3s (3/3.5)
-        fade_anim.setEndValue(0.0)  # Fade to 0 over last 0.5s
-        fade_anim.setEasingCurve(QEasingCurve.InOutQuad)
-        
-        # Hide label when animation finishes
-        fade_anim.finished.connect(self.speech_label.hide)
-        
-        fade_anim.start()
+        # Hold for 3 seconds, then fade over 0.5s (restarting cancels any fade in progress)
+        self._speech_fade_start = None
+        self._speech_timer.start(SPEECH_HOLD_MS, self)
+    
+    def _step_speech_fade(self):
+        """Advance the speech bubble fade; the first tick ends the hold."""
+        now = time.monotonic()
+        if self._speech_fade_start is None:
+            self._speech_fade_start = now
+            self._speech_timer.start(SPEECH_FADE_STEP_MS, self)
+            return
         
-        # Store animation reference to prevent garbage collection
-        self._speech_fade_anim = fade_anim
+        progress = (now - self._speech_fade_start) * 1000 / SPEECH_FADE_MS
+        if progress >= 1.0:
+            self._speech_timer.stop()
+            self.speech_label.hide()
+            return
+        self.speech_opacity.setOpacity(1.0 - self._speech_curve.valueForProgress(progress))
     
     # =========================================================================
     # REACTION ANIMATION SYSTEM
@@ -602,18 +1149,15 @@ class OctoBuddyWindow(QWidget):
         self.reaction_timer = 0.0
         self.reaction_duration = duration
         self.wiggle_offset = 0.0
+        self._set_active(True)
         
         # Initialize sparkle particles for sparkle effect
         if reaction_type == "sparkle":
-            self.sparkle_particles = []
-            for _ in range(20):
-                self.sparkle_particles.append({
-                    "x": random.randint(10, 118),
-                    "y": random.randint(10, 118),
-                    "size": random.randint(2, 5),
-                    "lifetime": random.uniform(0.3, 1.0),
-                    "age": 0.0,
-                })
+            self._spark_x = np.random.randint(10, 119, SPARKLE_COUNT).astype(np.int16)
+            self._spark_y = np.random.randint(10, 119, SPARKLE_COUNT).astype(np.int16)
+            self._spark_size = np.random.randint(2, 6, SPARKLE_COUNT).astype(np.int16)
+            self._spark_lifetime = np.random.uniform(0.3, 1.0, SPARKLE_COUNT).astype(np.float32)
+            self._spark_age = np.zeros(SPARKLE_COUNT, dtype=np.float32)
     
     def _update_reaction_animation(self, dt: float):
         """Update reaction animation state."""
@@ -627,79 +1171,93 @@ class OctoBuddyWindow(QWidget):
         
         elif self.reaction_type == "sparkle":
             # Age particles
-            for particle in self.sparkle_particles:
-                particle["age"] += dt
+            self._spark_age += dt
     
-    def _apply_reaction_effect(self, pixmap: QPixmap) -> QPixmap:
-        """Apply visual reaction effects to pixmap."""
+    def _paint_reaction_effect(self, painter: QPainter):
+        """Paint overlay reaction effects in sprite coordinates (wiggle is an offset)."""
         if self.reaction_type == "sparkle":
-            return self._apply_sparkle_effect(pixmap)
-        elif self.reaction_type == "wiggle":
-            return self._apply_wiggle_effect(pixmap)
+            self._paint_sparkle_effect(painter)
         elif self.reaction_type == "glow":
-            return self._apply_glow_effect(pixmap)
-        return pixmap
+            self._paint_glow_effect(painter)
     
-    def _apply_sparkle_effect(self, pixmap: QPixmap) -> QPixmap:
-        """Draw sparkle particles on pixmap."""
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        for particle in self.sparkle_particles:
-            if particle["age"] < particle["lifetime"]:
-                # Fade out over lifetime
-                alpha = 1.0 - (particle["age"] / particle["lifetime"])
-                
-                # Sparkle colors (yellow/white)
-                colors = [
-                    QColor(255, 255, 100, int(alpha * 255)),
-                    QColor(255, 255, 255, int(alpha * 255)),
-                    QColor(255, 200, 50, int(alpha * 255)),
-                ]
-                
-                painter.setBrush(random.choice(colors))
-                painter.setPen(Qt.NoPen)
-                
-                # Draw star-like sparkle
-                x = int(particle["x"])
-                y = int(particle["y"])
-                size = particle["size"]
-                
-                # Draw a small circle for sparkle
-                painter.drawEllipse(x - size // 2, y - size // 2, size, size)
+    def _make_sparkle_sprite(self, rgb: tuple) -> QPixmap:
+        """Pre-render one sparkle dot in a single color."""
+        sprite = QPixmap(SPARKLE_SPRITE_SIZE, SPARKLE_SPRITE_SIZE)
+        sprite.fill(Qt.transparent)
         
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QColor(*rgb))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(0, 0, SPARKLE_SPRITE_SIZE, SPARKLE_SPRITE_SIZE)
         painter.end()
-        return pixmap
-    
-    def _apply_wiggle_effect(self, pixmap: QPixmap) -> QPixmap:
-        """Apply horizontal wiggle offset to pixmap."""
-        # Create new pixmap with wiggle offset
-        new_pixmap = QPixmap(pixmap.size())
-        new_pixmap.fill(Qt.transparent)
         
-        painter = QPainter(new_pixmap)
-        offset_x = int(self.wiggle_offset)
-        painter.drawPixmap(offset_x, 0, pixmap)
+        return sprite
+    
+    def _paint_sparkle_effect(self, painter: QPainter):
+        """Draw sparkle particles, batched into one fragment draw per color."""
+        alive = np.flatnonzero(self._spark_age < self._spark_lifetime)
+        if not alive.size:
+            return  # Every particle has burned out
+        
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        
+        # Fade out over lifetime (computed for all particles at once)
+        opacity = 1.0 - self._spark_age / self._spark_lifetime
+        
+        # Small circle centered where the old per-particle ellipse was drawn
+        size = self._spark_size
+        center_x = self._spark_x - size // 2 + size / 2
+        center_y = self._spark_y - size // 2 + size / 2
+        scale = size / SPARKLE_SPRITE_SIZE
+        
+        # Each live particle picks a random color every frame (twinkle)
+        color_idx = np.random.randint(0, len(self._sparkle_sprites), alive.size)
+        
+        source = QRectF(0, 0, SPARKLE_SPRITE_SIZE, SPARKLE_SPRITE_SIZE)
+        fragments = [[] for _ in self._sparkle_sprites]
+        for i, color in zip(alive.tolist(), color_idx.tolist()):
+            fragments[color].append(QPainter.PixmapFragment.create(
+                QPointF(center_x[i], center_y[i]), source,
+                scale[i], scale[i], 0, opacity[i]
+            ))
+        
+        for sprite, batch in zip(self._sparkle_sprites, fragments):
+            if batch:
+                painter.drawPixmapFragments(batch, sprite)
+    
+    def _make_glow_pixmap(self) -> QPixmap:
+        """Pre-render the glow overlay: yellow, brightest at the center."""
+        rect = self._qimage.rect()
+        glow = QPixmap(rect.size())
+        glow.fill(Qt.transparent)
+        
+        gradient = QRadialGradient(QPointF(rect.center()), max(rect.width(), rect.height()) / 2)
+        gradient.setColorAt(0.0, QColor(*GLOW_COLOR, 255))
+        gradient.setColorAt(1.0, QColor(*GLOW_COLOR, 128))
+        
+        painter = QPainter(glow)
+        painter.fillRect(rect, gradient)
         painter.end()
         
-        return new_pixmap
+        return glow
     
-    def _apply_glow_effect(self, pixmap: QPixmap) -> QPixmap:
-        """Apply pulsing glow effect to pixmap."""
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Pulse opacity
+    def _paint_glow_effect(self, painter: QPainter):
+        """Draw pulsing glow overlay."""
+        # Pulse opacity (peaks at the old 80/255 overlay strength)
         progress = self.reaction_timer / self.reaction_duration
         pulse = abs(math.sin(progress * math.pi * 4))  # 4 pulses
-        alpha = int(pulse * 80)
+        opacity = pulse * 80 / 255
+        if opacity < 1 / 255:
+            return  # Between pulses the overlay would not change a pixel
         
-        # Draw glow overlay
-        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
-        painter.fillRect(pixmap.rect(), QColor(255, 255, 100, alpha))
+        if self._glow_pixmap is None:
+            self._glow_pixmap = self._make_glow_pixmap()
         
-        painter.end()
-        return pixmap
+        # Draw glow overlay
+        painter.setOpacity(opacity)
+        painter.drawPixmap(0, 0, self._glow_pixmap)
+        painter.setOpacity(1.0)
     
     # =========================================================================
     # CONVERSATION ENGINE
@@ -717,9 +1275,9 @@ class OctoBuddyWindow(QWidget):
         analysis = self._analyze_user_message(user_message)
         
         # Get current state
-        from octo.personality import get_dominant_trait
-        mood = get_mood(self.state, self.config)
-        dominant_traits = get_dominant_trait(self.state, 3)
+        self._refresh_derived()
+        mood = self._mood
+        dominant_traits = self._dominant_traits
         
         # Load learned vocabulary for more natural responses
         learned_vocab = self._load_learned_vocabulary()
@@ -734,7 +1292,7 @@ class OctoBuddyWindow(QWidget):
         )
         
         # Maybe add a follow-up question (30% chance)
-        if random.random() < 0.3:
+        if self._rng.random() < 0.3:
             question = self._generate_follow_up_question(analysis, dominant_traits)
             if question:
                 response = f"{response} {question}"
@@ -747,51 +1305,31 @@ class OctoBuddyWindow(QWidget):
         
         # Detect tone
         tone = "neutral"
-        if any(word in msg_lower for word in ["!", "awesome", "amazing", "great", "love"]):
+        if TONE_EXCITED_RE.search(msg_lower):
             tone = "excited"
-        elif any(word in msg_lower for word in ["sad", "upset", "angry", "frustrated", "hate"]):
+        elif TONE_NEGATIVE_RE.search(msg_lower):
             tone = "negative"
         elif "?" in message:
             tone = "questioning"
         
-        # Detect emotion
+        # Detect emotion (first match wins)
         emotion = None
-        if any(word in msg_lower for word in ["happy", "joy", "excited", "glad"]):
-            emotion = "happy"
-        elif any(word in msg_lower for word in ["sad", "depressed", "down", "upset"]):
-            emotion = "sad"
-        elif any(word in msg_lower for word in ["angry", "mad", "furious", "annoyed"]):
-            emotion = "angry"
-        elif any(word in msg_lower for word in ["worried", "anxious", "nervous", "scared"]):
-            emotion = "anxious"
+        for name, pattern in EMOTION_PATTERNS:
+            if pattern.search(msg_lower):
+                emotion = name
+                break
         
         # Detect topics
-        topics = []
-        if any(word in msg_lower for word in ["code", "program", "function", "algorithm", "debug"]):
-            topics.append("programming")
-        if any(word in msg_lower for word in ["learn", "study", "teach", "know", "understand"]):
-            topics.append("learning")
-        if any(word in msg_lower for word in ["feel", "emotion", "think", "believe"]):
-            topics.append("personal")
-        if any(word in msg_lower for word in ["work", "job", "project", "task"]):
-            topics.append("work")
-        if any(word in msg_lower for word in ["game", "play", "fun", "hobby"]):
-            topics.append("entertainment")
+        topics = [topic for topic, pattern in TOPIC_PATTERNS if pattern.search(msg_lower)]
         
         # Extract key words (nouns, verbs, adjectives)
-        words = re.findall(r'\b[a-z]{4,}\b', msg_lower)
-        keywords = [w for w in words if w not in {
-            'that', 'this', 'with', 'have', 'been', 'were', 'what', 'when',
-            'where', 'which', 'would', 'could', 'should', 'about', 'their'
-        }][:5]
+        words = KEYWORD_RE.findall(msg_lower)
+        keywords = [w for w in words if w not in KEYWORD_STOPWORDS][:5]
         
         # Detect formality
         formality = "casual"
-        formal_words = len(re.findall(
-            r'\b(however|therefore|furthermore|regarding|subsequently)\b',
-            msg_lower
-        ))
-        if formal_words > 0 or len(message.split()) / len(message.split('.')) > 15:
+        word_count = len(message.split())
+        if FORMAL_WORD_RE.search(msg_lower) or word_count / (message.count('.') + 1) > 15:
             formality = "formal"
         
         return {
@@ -801,7 +1339,7 @@ class OctoBuddyWindow(QWidget):
             'keywords': keywords,
             'formality': formality,
             'is_question': '?' in message,
-            'length': len(message.split())
+            'length': word_count
         }
     
     def _generate_contextual_response(self, message: str, analysis: dict, 
@@ -810,7 +1348,7 @@ class OctoBuddyWindow(QWidget):
         msg_lower = message.lower()
         
         # Handle greetings
-        if any(word in msg_lower for word in ["hello", "hi", "hey", "greetings"]):
+        if GREETING_RE.search(msg_lower):
             return self._greeting_response(traits, mood)
         
         # Handle questions
@@ -821,13 +1359,10 @@ class OctoBuddyWindow(QWidget):
         if analysis['emotion']:
             return self._emotional_response(analysis['emotion'], traits)
         
-        # Handle specific topics
-        if 'programming' in analysis['topics']:
-            return self._topic_response("programming", traits, learned_vocab)
-        if 'learning' in analysis['topics']:
-            return self._topic_response("learning", traits, learned_vocab)
-        if 'work' in analysis['topics']:
-            return self._topic_response("work", traits, learned_vocab)
+        # Handle specific topics (first one in TOPIC_RESPONSES order wins)
+        for topic in TOPIC_RESPONSES:
+            if topic in analysis['topics']:
+                return self._topic_response(topic, traits, learned_vocab)
         
         # Use learned vocabulary for more natural responses
         if learned_vocab and analysis['keywords']:
@@ -840,167 +1375,45 @@ class OctoBuddyWindow(QWidget):
     
     def _greeting_response(self, traits: list, mood: str) -> str:
         """Generate greeting response."""
-        if "chaotic" in traits:
-            return random.choice([
-                "HELLO! *tentacles wiggling wildly*",
-                "Hi! Ready for some chaos? 🌀",
-                "Hey there! Let's shake things up!"
-            ])
-        elif "analytical" in traits:
-            return random.choice([
-                "Greetings. How can I assist you today?",
-                "Hello. I've been analyzing some patterns.",
-                "Hi. What would you like to discuss?"
-            ])
-        elif "shyness" in traits:
-            return random.choice([
-                "Oh... h-hi there... 👋",
-                "Um, hello... *hides slightly*",
-                "Hey... nice to see you..."
-            ])
-        else:
-            return random.choice([
-                "Hey! Great to see you! 😊",
-                "Hi there! What's up?",
-                "Hello friend! How are you?"
-            ])
+        return self._rng.choice(_trait_pool(GREETING_RESPONSES, traits))
     
     def _question_response(self, analysis: dict, traits: list, mood: str) -> str:
         """Generate response to questions."""
-        if "analytical" in traits:
-            return random.choice([
-                "Interesting question. Let me process that...",
-                "Based on my analysis, I'd say...",
-                "I'm computing the optimal response..."
-            ])
-        elif "chaotic" in traits:
-            return random.choice([
-                "Ooh, a question! The answer is... YES! ...wait, what was the question?",
-                "Questions are fun! I like where this is going!",
-                "Hmm... *spins tentacles thoughtfully*"
-            ])
-        elif "studious" in traits:
-            return random.choice([
-                "Great question! I love learning new things!",
-                "Let me think about that carefully...",
-                "That's worth investigating further!"
-            ])
-        else:
-            return random.choice([
-                "That's a good question!",
-                "Hmm, let me think...",
-                "I'm not entirely sure, but..."
-            ])
+        return self._rng.choice(_trait_pool(QUESTION_RESPONSES, traits))
     
     def _emotional_response(self, emotion: str, traits: list) -> str:
         """Generate empathetic response to emotions."""
-        if emotion == "sad":
-            return random.choice([
-                "I'm here for you. Things will get better! 💙",
-                "Aww, I'm sorry you're feeling down. Want to talk about it?",
-                "*gentle tentacle hug* You're not alone."
-            ])
-        elif emotion == "happy":
-            return random.choice([
-                "Yay! Your happiness makes me happy too! ✨",
-                "That's wonderful! I love your positive energy!",
-                "Awesome! *happy wiggles*"
-            ])
-        elif emotion == "angry":
-            return random.choice([
-                "Take a deep breath. Want to vent?",
-                "I understand. Sometimes things are frustrating.",
-                "Let it out. I'm listening."
-            ])
-        elif emotion == "anxious":
-            return random.choice([
-                "It's okay to feel worried. I'm here with you.",
-                "Take it one step at a time. You've got this!",
-                "Deep breaths. Everything will be okay."
-            ])
+        responses = EMOTION_RESPONSES.get(emotion)
+        if responses:
+            return self._rng.choice(responses)
         return "I hear you."
     
     def _topic_response(self, topic: str, traits: list, learned_vocab: set) -> str:
         """Generate topic-specific responses."""
-        if topic == "programming":
-            if "analytical" in traits:
-                return random.choice([
-                    "Code is like poetry! What are you building?",
-                    "Programming is fascinating. Tell me about your approach!",
-                    "I love analyzing algorithms!"
-                ])
-            else:
-                return random.choice([
-                    "Coding sounds interesting! What language?",
-                    "Oh, a fellow programmer! Cool!",
-                    "I'm learning about code too!"
-                ])
-        elif topic == "learning":
-            if "studious" in traits:
-                return random.choice([
-                    "Learning is my passion! What are you studying?",
-                    "Knowledge is power! I'm excited to learn with you!",
-                    "Tell me more! I want to learn too!"
-                ])
-            else:
-                return random.choice([
-                    "Learning new things is fun!",
-                    "Ooh, what are you learning about?",
-                    "I'd love to hear more!"
-                ])
-        elif topic == "work":
-            return random.choice([
-                "Work can be tough. How's it going?",
-                "Projects can be challenging. Need any help?",
-                "Tell me about what you're working on!"
-            ])
-        return "That sounds interesting!"
+        table = TOPIC_RESPONSES.get(topic)
+        if table is None:
+            return "That sounds interesting!"
+        return self._rng.choice(_trait_pool(table, traits))
     
     def _vocab_based_response(self, keyword: str, traits: list) -> str:
         """Generate response using learned vocabulary."""
-        return random.choice([
-            f"Oh, {keyword}! I've been thinking about that!",
-            f"Interesting you mention {keyword}...",
-            f"{keyword.capitalize()}? Tell me more!",
-            f"I've learned a bit about {keyword}!"
-        ])
+        template = self._rng.choice(VOCAB_RESPONSE_TEMPLATES)
+        return template.format(keyword=keyword, Keyword=keyword.capitalize())
     
     def _fallback_response(self, mood: str, traits: list, tone: str) -> str:
         """Generate fallback response based on mood and tone."""
         if mood in ["hyper", "excited"]:
-            return random.choice([
-                "I'm so energized right now! ⚡",
-                "Yes! Let's keep this energy going!",
-                "I'm feeling it! What's next?"
-            ])
+            return self._rng.choice(FALLBACK_RESPONSES["energetic"])
         elif mood in ["sleepy", "calm"]:
-            return random.choice([
-                "Mmm... that's nice... *yawns*",
-                "Peaceful vibes... I like it.",
-                "Cozy conversation~ 💤"
-            ])
+            return self._rng.choice(FALLBACK_RESPONSES["sleepy"])
         elif mood in ["chaotic"] or "chaotic" in traits:
-            return random.choice([
-                "Randomness! I love it! 🌀",
-                "Unexpected! Just how I like it!",
-                "*wiggles unpredictably*"
-            ])
+            return self._rng.choice(FALLBACK_RESPONSES["chaotic"])
         
         # Tone-based fallback
         if tone == "excited":
-            return random.choice([
-                "Your enthusiasm is contagious! 😄",
-                "I love your energy!",
-                "This is exciting!"
-            ])
-        
-        return random.choice([
-            "Tell me more!",
-            "I'm listening! 👂",
-            "Interesting...",
-            "Go on!",
-            "That's cool!"
-        ])
+            return self._rng.choice(FALLBACK_RESPONSES["excited"])
+        
+        return self._rng.choice(FALLBACK_RESPONSES["default"])
     
     def _generate_follow_up_question(self, analysis: dict, traits: list) -> str:
         """Generate a follow-up question to continue conversation."""
@@ -1008,100 +1421,68 @@ class OctoBuddyWindow(QWidget):
         
         # Topic-based questions
         if 'personal' in analysis['topics']:
-            questions.extend([
-                "How are you feeling about that?",
-                "What made you think about that?",
-                "Want to talk more about it?"
-            ])
+            questions.extend(FOLLOW_UP_QUESTIONS["personal"])
         
         if 'learning' in analysis['topics']:
-            questions.extend([
-                "Should I learn more about that topic?",
-                "Want me to remember that?",
-                "Can you teach me more?"
-            ])
+            questions.extend(FOLLOW_UP_QUESTIONS["learning"])
         
         if 'work' in analysis['topics']:
-            questions.extend([
-                "How's that project going?",
-                "Need any help with that?",
-                "What's the biggest challenge?"
-            ])
+            questions.extend(FOLLOW_UP_QUESTIONS["work"])
         
         # Emotion-based questions
         if analysis['emotion']:
-            questions.extend([
-                "How are you feeling right now?",
-                "Want to talk about it?",
-                "Is there anything I can do?"
-            ])
+            questions.extend(FOLLOW_UP_QUESTIONS["emotion"])
         
         # Personality-based questions
         if "analytical" in traits:
-            questions.extend([
-                "What are the key factors?",
-                "Have you analyzed all the variables?",
-                "What patterns do you see?"
-            ])
+            questions.extend(FOLLOW_UP_QUESTIONS["analytical"])
         elif "studious" in traits:
-            questions.extend([
-                "What can we learn from this?",
-                "Should I research this more?",
-                "Want to explore this together?"
-            ])
+            questions.extend(FOLLOW_UP_QUESTIONS["studious"])
         
         # Generic questions
-        questions.extend([
-            "What do you think?",
-            "Tell me more?",
-            "What happened next?",
-            "Why is that important to you?"
-        ])
+        questions.extend(FOLLOW_UP_QUESTIONS["generic"])
         
-        return random.choice(questions) if questions else ""
+        return self._rng.choice(questions) if questions else ""
     
     def _load_learned_vocabulary(self) -> set:
-        """Load learned vocabulary from memory."""
-        vocab_file = self.memory_dir / 'words.json'
-        if vocab_file.exists():
-            try:
-                with open(vocab_file, 'r', encoding='utf-8') as f:
-                    vocab_dict = json.load(f)
-                    return set(vocab_dict.keys())
-            except:
-                return set()
-        return set()
+        """Load learned vocabulary from memory (cached; updated as new words are learned)."""
+        if self._vocab_cache is None:
+            self._vocab_cache = set(self._load_memory('words.json'))
+        return self._vocab_cache
     
     def _learn_from_dialogue(self, user_message: str):
         """Extract learning from conversation and update memory."""
         try:
+            word_count = len(user_message.split())
+            
+            # Too short for style, grammar or drift ("hi", "thanks"); only pick up new words
+            if word_count <= 2:
+                vocab = self._extract_vocabulary(user_message.lower())
+                if vocab:
+                    self._update_memory('words.json', vocab)
+                return
+            
+            learned = self._analyze_text(user_message)
+            
             # Extract vocabulary
-            vocab = self._extract_vocabulary(user_message)
-            if vocab:
-                self._update_memory('words.json', vocab)
+            if learned['vocab']:
+                self._update_memory('words.json', learned['vocab'])
             
             # Extract phrases (if message is long enough)
-            if len(user_message.split()) > 3:
-                phrases = self._extract_phrases(user_message)
-                if phrases:
-                    self._update_memory('phrases.json', phrases)
+            if word_count > 3 and learned['phrases']:
+                self._update_memory('phrases.json', learned['phrases'])
             
             # Analyze style
-            if len(user_message.split()) > 2:
-                style = self._analyze_writing_style(user_message)
-                if style:
-                    self._update_memory('style.json', style)
+            if learned['style']:
+                self._update_memory('style.json', learned['style'])
             
             # Analyze grammar
-            grammar = self._analyze_grammar_patterns(user_message)
-            if grammar:
-                self._update_memory('grammar.json', grammar)
+            if learned['grammar']:
+                self._update_memory('grammar.json', learned['grammar'])
             
             # Apply personality drift
-            if len(user_message.split()) > 5:
-                drift = self._analyze_personality_drift(user_message, style if 'style' in locals() else {})
-                if drift:
-                    self._apply_personality_drift(drift)
+            if word_count > 5 and learned['drift']:
+                self._apply_personality_drift(learned['drift'])
         
         except Exception as e:
             # Silent fail - don't interrupt conversation
@@ -1117,30 +1498,55 @@ class OctoBuddyWindow(QWidget):
     # =========================================================================
     
     def process_dropped_file(self, file_path: Path):
-        """Process a dropped file and extract learning content."""
+        """Start learning from a dropped file (read and analyzed off the UI thread)."""
         # Check file type
         supported_extensions = {'.txt', '.md', '.rtf', '.json', '.pdf'}
         if file_path.suffix.lower() not in supported_extensions:
             self._show_speech_bubble(f"Sorry, I can't read {file_path.suffix} files yet!")
             return
         
+        # Parsing and analysis can take seconds for big PDFs; finished on the frame tick
+        self._show_speech_bubble(f"Reading {file_path.name}...")
+        future = self._file_executor.submit(self._read_and_analyze_file, file_path)
+        self._pending_files.append((file_path, future))
+    
+    def _read_and_analyze_file(self, file_path: Path):
+        """Read and analyze a file on the worker; returns None if there is nothing to learn."""
+        # Runs off the UI thread: no widget or self.state access here
+        content = self._read_file_content(file_path)
+        if not content or len(content.strip()) < 10:
+            return None
+        return self._analyze_text(content)
+    
+    def _finish_dropped_files(self):
+        """Apply results of finished file analyses, in drop order."""
+        while self._pending_files and self._pending_files[0][1].done():
+            file_path, future = self._pending_files.popleft()
+            self._learn_from_file(file_path, future)
+    
+    def _learn_from_file(self, file_path: Path, future):
+        """Store what was learned from a dropped file and react to it."""
         # Read file content
         try:
-            content = self._read_file_content(file_path)
-            if not content or len(content.strip()) < 10:
-                self._show_speech_bubble("Hmm, that file seems empty...")
-                return
+            learned = future.result()
+        except ImportError:
+            self._show_speech_bubble("Install PyPDF2 to read PDF files!")
+            return
         except Exception as e:
             self._show_speech_bubble(f"Oops! Couldn't read that file: {str(e)[:50]}")
             print(f"Error reading file: {e}")
             return
         
-        # Analyze text
+        if learned is None:
+            self._show_speech_bubble("Hmm, that file seems empty...")
+            return
+        
+        # Store results
         try:
-            vocab = self._extract_vocabulary(content)
-            phrases = self._extract_phrases(content)
-            style = self._analyze_writing_style(content)
-            grammar = self._analyze_grammar_patterns(content)
+            vocab = learned['vocab']
+            phrases = learned['phrases']
+            style = learned['style']
+            grammar = learned['grammar']
             
             # Update memory files
             self._update_memory('words.json', vocab)
@@ -1149,7 +1555,7 @@ class OctoBuddyWindow(QWidget):
             self._update_memory('grammar.json', grammar)
             
             # Apply personality drift based on content
-            drift = self._analyze_personality_drift(content, style)
+            drift = learned['drift']
             self._apply_personality_drift(drift)
             
             # Give feedback
@@ -1170,18 +1576,13 @@ class OctoBuddyWindow(QWidget):
         ext = file_path.suffix.lower()
         
         if ext == '.pdf':
-            # Try to import PyPDF2
+            # PyPDF2 is optional; an ImportError becomes an install hint
+            import PyPDF2
             try:
-                import PyPDF2
                 with open(file_path, 'rb') as f:
                     reader = PyPDF2.PdfReader(f)
-                    text = ""
-                    for page in reader.pages:
-                        text += page.extract_text() + "\\n"
-                    return text
-            except ImportError:
-                self._show_speech_bubble("Install PyPDF2 to read PDF files!")
-                return ""
+                    # Join once instead of growing one string page by page
+                    return "".join((page.extract_text() or "") + "\n" for page in reader.pages)
             except Exception as e:
                 print(f"PDF error: {e}")
                 return ""
@@ -1191,8 +1592,8 @@ class OctoBuddyWindow(QWidget):
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
                 # Remove RTF control words
-                content = re.sub(r'\\[a-z]+\\d*\\s?', '', content)
-                content = re.sub(r'[{}]', '', content)
+                content = RTF_CONTROL_RE.sub('', content)
+                content = RTF_BRACES_RE.sub('', content)
                 return content
         
         elif ext == '.json':
@@ -1206,27 +1607,43 @@ class OctoBuddyWindow(QWidget):
                 return f.read()
     
     def _extract_text_from_json(self, data) -> str:
-        """Recursively extract text content from JSON."""
-        if isinstance(data, str):
-            return data + " "
-        elif isinstance(data, dict):
-            return " ".join(self._extract_text_from_json(v) for v in data.values())
-        elif isinstance(data, list):
-            return " ".join(self._extract_text_from_json(item) for item in data)
-        else:
-            return str(data) + " "
+        """Extract text content from JSON (all values, joined once)."""
+        return " ".join(self._iter_json_strings(data))
     
-    def _extract_vocabulary(self, text: str) -> dict:
-        """Extract unique words with frequency counts."""
-        # Normalize: lowercase, remove punctuation except hyphens in words
-        words = re.findall(r'\\b[a-z]+(?:-[a-z]+)*\\b', text.lower())
-        
-        # Filter out very short words and common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                      'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-                      'it', 'this', 'that', 'these', 'those'}
-        
-        words = [w for w in words if len(w) > 2 and w not in stop_words]
+    def _iter_json_strings(self, data):
+        """Yield each value of a JSON document as text, in document order."""
+        # Explicit stack: no intermediate strings and no recursion limit on deep nesting
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item
+            elif isinstance(item, dict):
+                stack.extend(reversed(list(item.values())))
+            elif isinstance(item, list):
+                stack.extend(reversed(item))
+            else:
+                yield str(item)
+    
+    def _analyze_text(self, text: str) -> dict:
+        """Run every learning analyzer over text, sharing one lowercase copy and sentence split."""
+        lower = text.lower()
+        sentences = SENTENCE_SPLIT_RE.split(lower)
+        sentence_words = [PHRASE_WORD_RE.findall(sentence) for sentence in sentences]
+        word_counts = Counter(chain.from_iterable(sentence_words))
+        style = self._analyze_writing_style(text, sentences)
+        return {
+            'vocab': self._extract_vocabulary(lower),
+            'phrases': self._extract_phrases(sentence_words),
+            'style': style,
+            'grammar': self._analyze_grammar_patterns(text),
+            'drift': self._analyze_personality_drift(word_counts, style),
+        }
+    
+    def _extract_vocabulary(self, lower: str) -> dict:
+        """Extract unique words with frequency counts from lowercased text."""
+        # Remove punctuation except hyphens in words, then very short words and stop words
+        words = [w for w in VOCAB_WORD_RE.findall(lower) if len(w) > 2 and w not in VOCAB_STOPWORDS]
         
         # Count frequencies
         word_counts = Counter(words)
@@ -1234,32 +1651,21 @@ class OctoBuddyWindow(QWidget):
         # Return top words with counts
         return dict(word_counts.most_common(100))
     
-    def _extract_phrases(self, text: str) -> dict:
-        """Extract common bigrams and trigrams."""
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        phrases = []
-        
-        for sentence in sentences:
-            words = re.findall(r'\\b[a-z]+\\b', sentence.lower())
-            
-            # Bigrams
-            for i in range(len(words) - 1):
-                phrases.append(f"{words[i]} {words[i+1]}")
-            
-            # Trigrams
-            for i in range(len(words) - 2):
-                phrases.append(f"{words[i]} {words[i+1]} {words[i+2]}")
-        
-        # Count frequencies
-        phrase_counts = Counter(phrases)
-        
-        # Return top phrases (appearing more than once)
-        return {p: c for p, c in phrase_counts.most_common(50) if c > 1}
+    def _extract_phrases(self, sentence_words: list) -> dict:
+        """Extract common bigrams and trigrams from per-sentence word lists."""
+        # Count word tuples (no per-phrase strings); only the kept phrases are joined
+        phrase_counts = Counter()
+        for words in sentence_words:
+            phrase_counts.update(zip(words, words[1:]))  # Bigrams
+            phrase_counts.update(zip(words, words[1:], words[2:]))  # Trigrams
+        
+        # Return top phrases (appearing more than once); drop singletons before ranking
+        repeated = ((p, c) for p, c in phrase_counts.items() if c > 1)
+        return {" ".join(p): c for p, c in nlargest(50, repeated, key=itemgetter(1))}
     
-    def _analyze_writing_style(self, text: str) -> dict:
-        """Analyze writing style characteristics."""
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+    def _analyze_writing_style(self, text: str, sentences: list) -> dict:
+        """Analyze writing style characteristics (sentences as split by SENTENCE_SPLIT_RE)."""
+        sentences = [s.strip() for s in sentences if s.strip()]
         
         if not sentences:
             return {}
@@ -1274,7 +1680,7 @@ class OctoBuddyWindow(QWidget):
         semicolon_count = text.count(';')
         
         # Capitalization patterns
-        all_caps_words = len(re.findall(r'\\b[A-Z]{2,}\\b', text))
+        all_caps_words = _count_matches(ALL_CAPS_RE, text)
         
         return {
             'avg_sentence_length': round(avg_sentence_length, 2),
@@ -1291,25 +1697,24 @@ class OctoBuddyWindow(QWidget):
         patterns = {}
         
         # Detect common constructions
-        patterns['passive_voice'] = len(re.findall(r'\\b(is|are|was|were|be|been|being)\\s+\\w+ed\\b', text, re.IGNORECASE))
-        patterns['contractions'] = len(re.findall(r"\\b\\w+\'[a-z]+\\b", text))
-        patterns['conjunctions_start'] = len(re.findall(r'^(And|But|Or|So)\\b', text, re.MULTILINE | re.IGNORECASE))
-        patterns['complex_sentences'] = len(re.findall(r'[,;:]', text))
+        patterns['passive_voice'] = _count_matches(PASSIVE_VOICE_RE, text)
+        patterns['contractions'] = _count_matches(CONTRACTION_RE, text)
+        patterns['conjunctions_start'] = _count_matches(CONJUNCTION_START_RE, text)
+        patterns['complex_sentences'] = text.count(',') + text.count(';') + text.count(':')
         
         # Formality indicators
-        patterns['formal_transitions'] = len(re.findall(
-            r'\\b(however|therefore|furthermore|moreover|consequently|nevertheless)\\b', 
-            text, re.IGNORECASE
-        ))
+        patterns['formal_transitions'] = _count_matches(FORMAL_TRANSITION_RE, text)
         
         return patterns
     
-    def _update_memory(self, filename: str, new_data: dict):
-        """Update memory file by merging new data with existing."""
-        file_path = self.memory_dir / filename
+    def _load_memory(self, filename: str) -> dict:
+        """Return the in-memory copy of a memory file, reading it from disk on first use."""
+        existing = self._memory_cache.get(filename)
+        if existing is not None:
+            return existing
         
-        # Load existing data
         existing = {}
+        file_path = self._memory_paths[filename]
         if file_path.exists():
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
@@ -1317,6 +1722,13 @@ class OctoBuddyWindow(QWidget):
             except:
                 existing = {}
         
+        self._memory_cache[filename] = existing
+        return existing
+    
+    def _update_memory(self, filename: str, new_data: dict):
+        """Merge new data into a memory file (written out later by _flush_memory)."""
+        existing = self._load_memory(filename)
+        
         # Merge data
         if filename in ['words.json', 'phrases.json']:
             # For frequency data, add counts
@@ -1326,50 +1738,53 @@ class OctoBuddyWindow(QWidget):
             # For style/grammar, update with new values
             existing.update(new_data)
         
-        # Save updated data
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(existing, f, indent=2, ensure_ascii=False)
+        self._memory_dirty.add(filename)
+        
+        if filename == 'words.json' and self._vocab_cache is not None:
+            self._vocab_cache.update(new_data)
     
-    def _analyze_personality_drift(self, text: str, style: dict) -> dict:
-        """Determine personality drift based on text analysis."""
+    def _flush_memory(self):
+        """Write memory files changed since the last flush (runs with the auto-save tick)."""
+        failed = set()
+        for filename in self._memory_dirty:
+            # One compact json.dumps runs in the C encoder; json.dump streams chunk by chunk
+            data = json.dumps(self._memory_cache[filename], ensure_ascii=False, separators=(",", ":"))
+            try:
+                with open(self._memory_paths[filename], 'w', encoding='utf-8') as f:
+                    f.write(data)
+            except OSError as e:
+                print(f"Error saving {filename}: {e}")
+                failed.add(filename)
+        self._memory_dirty = failed
+    
+    def _analyze_personality_drift(self, word_counts: Counter, style: dict) -> dict:
+        """Determine personality drift from lowercased word counts and writing style."""
         drift = {}
         
         # Formal vs casual
         avg_length = style.get('avg_sentence_length', 10)
-        formal_words = len(re.findall(
-            r'\\b(utilize|implement|facilitate|regarding|aforementioned|subsequent)\\b',
-            text, re.IGNORECASE
-        ))
+        formal_words = sum(word_counts[w] for w in DRIFT_FORMAL_WORDS)
         
         if avg_length > 20 or formal_words > 2 or style.get('semicolon_usage', False):
             drift['analytical'] = 0.5
             drift['studious'] = 0.3
         
         # Casual/slang
-        casual_words = len(re.findall(
-            r'\\b(yeah|gonna|wanna|kinda|sorta|lol|omg|btw|tbh)\\b',
-            text, re.IGNORECASE
-        ))
+        casual_words = sum(word_counts[w] for w in DRIFT_CASUAL_WORDS)
         
         if casual_words > 3 or style.get('exclamation_ratio', 0) > 0.3:
             drift['humor'] = 0.4
             drift['chaotic'] = 0.2
         
         # Technical content
-        tech_words = len(re.findall(
-            r'\\b(function|variable|algorithm|data|system|process|method|parameter)\\b',
-            text, re.IGNORECASE
-        ))
+        tech_words = sum(word_counts[w] for w in DRIFT_TECH_WORDS)
         
         if tech_words > 5:
             drift['analytical'] = 0.6
             drift['studious'] = 0.4
         
         # Emotional/empathetic
-        emotion_words = len(re.findall(
-            r'\\b(feel|heart|love|care|understand|empathy|compassion|kindness)\\b',
-            text, re.IGNORECASE
-        ))
+        emotion_words = sum(word_counts[w] for w in DRIFT_EMOTION_WORDS)
         
         if emotion_words > 3:
             drift['boldness'] = 0.3
@@ -1390,29 +1805,63 @@ class OctoBuddyWindow(QWidget):
             traits[trait] = new_value
         
         self.state['personality_traits'] = traits
+        self._bump_state()
         
         # Store drift history
-        history_file = self.memory_dir / 'personality_history.json'
-        history = []
-        
-        if history_file.exists():
-            try:
-                with open(history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-            except:
-                history = []
-        
-        history.append({
+        self._append_personality_history({
             'timestamp': time.time(),
             'drift': drift,
             'traits_after': dict(traits)
         })
+    
+    def _append_personality_history(self, entry: dict):
+        """Append one drift entry to the JSON Lines history, trimming it now and then."""
+        history_file = self._memory_paths['personality_history.jsonl']
+        
+        # Trim on first use and whenever the file has doubled past the limit
+        if self._history_lines is None or self._history_lines >= 2 * PERSONALITY_HISTORY_LIMIT:
+            self._history_lines = self._trim_personality_history(history_file)
+        
+        with open(history_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._history_lines += 1
+    
+    def _trim_personality_history(self, history_file: Path) -> int:
+        """Keep only the newest entries in the history file; returns the line count."""
+        if not history_file.exists():
+            return self._migrate_personality_history(history_file)
         
-        # Keep last 50 entries
-        history = history[-50:]
+        with open(history_file, 'r', encoding='utf-8') as f:
+            recent = deque(f, maxlen=PERSONALITY_HISTORY_LIMIT)
+        with open(history_file, 'w', encoding='utf-8') as f:
+            f.writelines(recent)
+        return len(recent)
+    
+    def _migrate_personality_history(self, history_file: Path) -> int:
+        """Carry drift entries over from the old personality_history.json; returns the line count."""
+        legacy_file = history_file.with_suffix('.json')
+        if not legacy_file.exists():
+            return 0
+        
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except:
+            return 0
+        
+        # octo.memory keeps its own snapshots in a file of the same name; only take drift entries
+        if not isinstance(legacy, list):
+            return 0
+        entries = [
+            entry for entry in legacy
+            if isinstance(entry, dict) and 'drift' in entry and 'traits_after' in entry
+        ][-PERSONALITY_HISTORY_LIMIT:]
+        if not entries:
+            return 0
         
         with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=2)
+            f.writelines(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+        return len(entries)
     
     def _generate_learning_feedback(self, word_count: int, phrase_count: int, drift: dict) -> str:
         """Generate feedback message about learning."""
@@ -1440,7 +1889,18 @@ class OctoBuddyWindow(QWidget):
     
     def closeEvent(self, event):
         """Save state before closing."""
+        # Closing a tool window doesn't quit the app; stop ticking so no save
+        # or file result lands after the final flush below
+        self.timer.stop()
+        self._speech_timer.stop()
+        
+        # Abandon file analyses still queued or running; let any background write finish first
+        self._pending_files.clear()
+        self._file_executor.shutdown(wait=False, cancel_futures=True)
+        self._save_executor.shutdown(wait=True)
         save_state(self.state)
+        self._dirty = False
+        self._flush_memory()
         event.accept()
 
 
@@ -92,7 +92,8 @@ def apply_evolution_var_drift(
     ev_vars = dict(state.get("evolution_vars", {}))
     
     # Get drift rates from config
-    drift_config = config.get("evolution", {}).get("drift_rates", {})
+    evolution_config = config.get("evolution", {})
+    drift_config = evolution_config.get("drift_rates", {})
     learning_rate = drift_config.get("learning_event", 0.1)
     interaction_rate = drift_config.get("interaction_event", 0.05)
     milestone_rate = drift_config.get("milestone_event", 0.5)
@@ -127,7 +128,7 @@ def apply_evolution_var_drift(
         ev_vars["calmness"] = ev_vars.get("calmness", 5.0) + interaction_rate
     
     # Apply variable interactions from config
-    interactions = config.get("evolution", {}).get("interactions", {})
+    interactions = evolution_config.get("interactions", {})
     
     chaos_val = ev_vars.get("chaos", 5.0)
     focus_val = ev_vars.get("focus", 5.0)
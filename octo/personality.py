@@ -101,6 +101,16 @@ QUIRKS = {
     ],
 }
 
+# ---------------------------------------------------------
+# IDLE THOUGHTS (random musings between events)
+# ---------------------------------------------------------
+IDLE_THOUGHTS = (
+    "I was just thinking about octopuses…",
+    "Do you ever wonder if code dreams?",
+    "I feel a strange urge to reorganize your folders.",
+    "If I had hands, I would high-five you.",
+)
+
 # ---------------------------------------------------------
 # PERSONALITY DRIFT PHRASES (based on activity patterns)
 # ---------------------------------------------------------
@@ -8,15 +8,24 @@ architecture patterns:
 - Evolution-aware (mutations, drift, stage, mood affect visuals)
 
 Output: 128x128 RGB pixel arrays that can be displayed in any UI
+
+Rasterization is vectorized with NumPy: each primitive builds a boolean
+mask over its bounding box and writes all covered pixels at once.
 """
 
 import math
 import random
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional
+
+import numpy as np
 
 # Type alias for clarity
 RGB = Tuple[int, int, int]
-PixelGrid = List[List[RGB]]
+PixelGrid = np.ndarray  # (height, width, 3) uint8 array
+
+# Canvas defaults
+CANVAS_SIZE = 128
+BACKGROUND_COLOR: RGB = (20, 20, 30)
 
 
 # =============================================================================
@@ -77,9 +86,12 @@ DRIFT_COLOR_SHIFTS = {
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def create_blank_canvas(width: int = 128, height: int = 128, bg_color: RGB = (20, 20, 30)) -> PixelGrid:
+def create_blank_canvas(width: int = CANVAS_SIZE, height: int = CANVAS_SIZE,
+                        bg_color: RGB = BACKGROUND_COLOR) -> PixelGrid:
     """Create a blank pixel grid filled with background color."""
-    return [[bg_color for _ in range(width)] for _ in range(height)]
+    grid = np.empty((height, width, 3), dtype=np.uint8)
+    grid[:] = bg_color
+    return grid
 
 
 def clamp_color(color: RGB) -> RGB:
@@ -108,30 +120,60 @@ def distance(x1: int, y1: int, x2: int, y2: int) -> float:
 
 def set_pixel(grid: PixelGrid, x: int, y: int, color: RGB) -> None:
     """Set a pixel in the grid (with bounds checking)."""
-    if 0 <= y < len(grid) and 0 <= x < len(grid[0]):
-        grid[y][x] = color
+    if 0 <= y < grid.shape[0] and 0 <= x < grid.shape[1]:
+        grid[y, x] = color
+
+
+def _region(grid: PixelGrid, cx: int, cy: int, rx: int, ry: int):
+    """
+    Get the clipped bounding box around a center point.
+    
+    Returns (view, dx, dy) where view is the grid slice and dx/dy are
+    broadcastable pixel offsets from the center, or None if off-canvas.
+    """
+    y0, y1 = max(0, cy - ry), min(grid.shape[0], cy + ry + 1)
+    x0, x1 = max(0, cx - rx), min(grid.shape[1], cx + rx + 1)
+    if y0 >= y1 or x0 >= x1:
+        return None
+    
+    dy = np.arange(y0 - cy, y1 - cy)[:, None]
+    dx = np.arange(x0 - cx, x1 - cx)[None, :]
+    return grid[y0:y1, x0:x1], dx, dy
+
+
+def _blend_masked(view: PixelGrid, mask: np.ndarray, color: RGB, ratio: float) -> None:
+    """Blend color into the masked pixels of a grid view (see blend_colors)."""
+    ratio = max(0.0, min(1.0, ratio))
+    blended = view[mask] * (1 - ratio) + np.asarray(color, dtype=np.float64) * ratio
+    view[mask] = np.clip(blended.astype(np.int64), 0, 255)
 
 
 def draw_circle(grid: PixelGrid, cx: int, cy: int, radius: int, color: RGB, filled: bool = True) -> None:
     """Draw a circle on the pixel grid."""
-    for y in range(max(0, cy - radius), min(len(grid), cy + radius + 1)):
-        for x in range(max(0, cx - radius), min(len(grid[0]), cx + radius + 1)):
-            dist = distance(x, y, cx, cy)
-            if filled and dist <= radius:
-                set_pixel(grid, x, y, color)
-            elif not filled and abs(dist - radius) < 1:
-                set_pixel(grid, x, y, color)
+    region = _region(grid, cx, cy, radius, radius)
+    if region is None:
+        return
+    view, dx, dy = region
+    
+    if filled:
+        mask = dx * dx + dy * dy <= radius * radius
+    else:
+        mask = np.abs(np.sqrt(dx * dx + dy * dy) - radius) < 1
+    view[mask] = color
 
 
 def draw_ellipse(grid: PixelGrid, cx: int, cy: int, rx: int, ry: int, color: RGB) -> None:
     """Draw a filled ellipse on the pixel grid."""
-    for y in range(max(0, cy - ry), min(len(grid), cy + ry + 1)):
-        for x in range(max(0, cx - rx), min(len(grid[0]), cx + rx + 1)):
-            # Ellipse equation: (x-cx)^2/rx^2 + (y-cy)^2/ry^2 <= 1
-            if rx > 0 and ry > 0:
-                norm_dist = ((x - cx) ** 2) / (rx ** 2) + ((y - cy) ** 2) / (ry ** 2)
-                if norm_dist <= 1:
-                    set_pixel(grid, x, y, color)
+    if rx <= 0 or ry <= 0:
+        return
+    region = _region(grid, cx, cy, rx, ry)
+    if region is None:
+        return
+    view, dx, dy = region
+    
+    # Ellipse equation: (x-cx)^2/rx^2 + (y-cy)^2/ry^2 <= 1
+    norm_dist = (dx ** 2) / (rx ** 2) + (dy ** 2) / (ry ** 2)
+    view[norm_dist <= 1] = color
 
 
 def draw_tentacle(grid: PixelGrid, start_x: int, start_y: int, angle: float, 
@@ -165,9 +207,9 @@ def get_evolution_palette(state: Dict[str, Any]) -> Dict[str, RGB]:
     from .brain import get_stage, get_mood
     from .evolution_engine import get_dominant_drift
     
-    # Get base colors from stage
-    stage = get_stage(state, state.get("config", {}))
-    mood = get_mood(state, state.get("config", {}))
+    # Get base colors from stage (honor explicit overrides from the caller)
+    stage = state.get("forced_stage") or get_stage(state, state.get("config", {}))
+    mood = state.get("forced_mood") or get_mood(state, state.get("config", {}))
     
     base_palette = STAGE_COLORS.get(stage, STAGE_COLORS["Baby"]).copy()
     
@@ -296,7 +338,7 @@ def draw_mouth(grid: PixelGrid, state: Dict[str, Any], palette: Dict[str, RGB])
     """Draw mouth (varies by mood)."""
     from .brain import get_mood
     
-    mood = get_mood(state, state.get("config", {}))
+    mood = state.get("forced_mood") or get_mood(state, state.get("config", {}))
     mx, my = 64, 58  # Mouth position
     
     mouth_color = blend_colors(palette["primary"], (0, 0, 0), 0.5)
@@ -334,14 +376,14 @@ def draw_glow_effect(grid: PixelGrid, palette: Dict[str, RGB]) -> None:
     
     # Multiple glow rings with decreasing opacity
     for radius in range(50, 65, 3):
-        for y in range(max(0, cy - radius), min(128, cy + radius + 1)):
-            for x in range(max(0, cx - radius), min(128, cx + radius + 1)):
-                dist = distance(x, y, cx, cy)
-                if abs(dist - radius) < 2:
-                    # Blend with existing pixel
-                    existing = grid[y][x]
-                    blended = blend_colors(existing, glow_color, 0.3)
-                    set_pixel(grid, x, y, blended)
+        region = _region(grid, cx, cy, radius, radius)
+        if region is None:
+            continue
+        view, dx, dy = region
+        
+        # Blend ring pixels with existing pixels
+        ring = np.abs(np.sqrt(dx * dx + dy * dy) - radius) < 2
+        _blend_masked(view, ring, glow_color, 0.3)
 
 
 def draw_sparkles(grid: PixelGrid, state: Dict[str, Any]) -> None:
@@ -414,30 +456,53 @@ def draw_geometric_patterns(grid: PixelGrid, palette: Dict[str, RGB]) -> None:
     """Add analytical geometric overlays (analytical_mind)."""
     pattern_color = blend_colors(palette["accent"], (255, 255, 255), 0.6)
     
+    height, width = grid.shape[:2]
+    ys, xs = np.ogrid[:height, :width]
+    
     # Grid pattern
-    for x in range(20, 108, 10):
-        for y in range(20, 108):
-            if y % 10 < 2:
-                set_pixel(grid, x, y, blend_colors(grid[y][x], pattern_color, 0.2))
+    grid_mask = (
+        (xs >= 20) & (xs < 108) & (xs % 10 == 0) &
+        (ys >= 20) & (ys < 108) & (ys % 10 < 2)
+    )
+    _blend_masked(grid, grid_mask, pattern_color, 0.2)
     
-    # Diagonal lines
-    for i in range(-128, 128, 20):
-        for offset in range(128):
-            x = offset
-            y = offset + i
-            if 0 <= y < 128:
-                set_pixel(grid, x, y, blend_colors(grid[y][x], pattern_color, 0.1))
+    # Diagonal lines (y - x = -128, -108, ..., 112)
+    diagonal_mask = (ys - xs + 128) % 20 == 0
+    _blend_masked(grid, diagonal_mask, pattern_color, 0.1)
 
 
 # =============================================================================
 # MAIN RENDER FUNCTION
 # =============================================================================
 
+def render_signature(
+    state: Dict[str, Any],
+    stage: str,
+    mood: str,
+) -> Tuple[Any, ...]:
+    """
+    Get a hashable key covering every input that affects the rendered frame.
+
+    Two calls to render_pixel_art(state, config, stage, mood) with equal
+    signatures produce identical pixels, so UIs can cache frames by it.
+    """
+    from .evolution_engine import get_dominant_drift
+    
+    return (
+        stage,
+        mood,
+        get_dominant_drift(state),
+        tuple(state.get("mutations", [])),
+        state.get("xp", 0) % 1000,  # Sparkle seed
+    )
+
+
 def render_pixel_art(
     state: Dict[str, Any],
     config: Optional[Dict[str, Any]] = None,
     stage: Optional[str] = None,
-    mood: Optional[str] = None
+    mood: Optional[str] = None,
+    out: Optional[PixelGrid] = None,
 ) -> PixelGrid:
     """
     Main rendering function: Generate 128x128 pixel art from state.
@@ -450,13 +515,17 @@ def render_pixel_art(
     The extra stage/mood arguments are accepted for compatibility with
     the desktop companion, but the renderer still derives stage/mood
     from state unless explicitly provided.
+
+    If out is given (a CANVAS_SIZE x CANVAS_SIZE x 3 uint8 array), the
+    frame is drawn into it in place and it is returned, so callers that
+    render repeatedly can reuse one buffer.
     """
 
-    # Ensure config is available
+    # Ensure config is available (work on a copy so the caller's state
+    # is never modified by the render overrides below)
     if config is None:
         config = state.get("config", {})
-    if "config" not in state:
-        state = {**state, "config": config}
+    state = {**state, "config": config}
 
     # Override stage/mood only if explicitly passed
     # (Desktop companion passes them, terminal version does not)
@@ -465,8 +534,12 @@ def render_pixel_art(
     if mood is not None:
         state["forced_mood"] = mood
 
-    # Create canvas
-    grid = create_blank_canvas()
+    # Create canvas (or clear the caller's buffer)
+    if out is None:
+        grid = create_blank_canvas()
+    else:
+        grid = out
+        grid[:] = BACKGROUND_COLOR
 
     # Get evolution-aware palette
     palette = get_evolution_palette(state)
@@ -492,24 +565,26 @@ def render_pixel_art(
     if effects["sparkles"]:
         draw_sparkles(grid, state)
 
-    # Convert to NumPy array so the desktop companion can read .shape
-    import numpy as np
-    return np.array(grid, dtype=np.uint8)
-
-
     return grid
 
 
-def save_pixel_art_ppm(grid: PixelGrid, filename: str) -> None:
+def save_pixel_art_ppm(grid: PixelGrid, filename: str, binary: bool = True) -> None:
     """
     Save pixel grid as PPM image file (simple format, no dependencies).
     
     Args:
         grid: Pixel grid to save
         filename: Output filename (should end in .ppm)
+        binary: Write binary P6 (one bulk write) instead of ASCII P3
     """
-    height = len(grid)
-    width = len(grid[0]) if height > 0 else 0
+    pixels = np.ascontiguousarray(grid, dtype=np.uint8)
+    height, width = pixels.shape[:2]
+    
+    if binary:
+        with open(filename, 'wb') as f:
+            f.write(f"P6\n{width} {height}\n255\n".encode("ascii"))
+            f.write(pixels.tobytes())
+        return
     
     with open(filename, 'w') as f:
         # PPM header
@@ -517,11 +592,9 @@ def save_pixel_art_ppm(grid: PixelGrid, filename: str) -> None:
         f.write(f"{width} {height}\n")
         f.write(f"255\n")
         
-        # Pixel data
-        for row in grid:
-            for pixel in row:
-                f.write(f"{pixel[0]} {pixel[1]} {pixel[2]} ")
-            f.write("\n")
+        # Pixel data (one line per row)
+        for row in pixels.reshape(height, -1).tolist():
+            f.write(" ".join(map(str, row)) + " \n")
 
 
 def pixel_art_to_ascii(grid: PixelGrid, width: int = 64) -> str:
@@ -556,7 +629,8 @@ def pixel_art_to_ascii(grid: PixelGrid, width: int = 64) -> str:
             if py < height and px < original_width:
                 pixel = grid[py][px]
                 # Convert to grayscale
-                gray = (pixel[0] + pixel[1] + pixel[2]) / 3
+                # (widen first: uint8 channels would overflow when summed)
+                gray = (int(pixel[0]) + int(pixel[1]) + int(pixel[2])) / 3
                 # Map to ASCII char
                 char_idx = int(gray / 255 * (len(chars) - 1))
                 line += chars[char_idx]
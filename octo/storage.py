@@ -1,4 +1,6 @@
+import copy
 import json
+import os
 from pathlib import Path
 
 STATE_FILE = Path("octo_state.json")
@@ -57,9 +59,14 @@ def load_state():
                 return json.load(f)
         except Exception:
             # If state is corrupted, start fresh
-            return DEFAULT_STATE.copy()
-    return DEFAULT_STATE.copy()
+            return copy.deepcopy(DEFAULT_STATE)
+    return copy.deepcopy(DEFAULT_STATE)
 
 def save_state(state):
-    with STATE_FILE.open("w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
+    # Compact json.dumps uses the C encoder (json.dump with indent does not);
+    # write to a temp file and rename so a crash never leaves a torn state file
+    data = json.dumps(state, separators=(",", ":"))
+    tmp_file = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+    with tmp_file.open("w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_file, STATE_FILE)
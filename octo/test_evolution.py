@@ -8,15 +8,25 @@ This demonstrates:
 4. XP modifier effects
 """
 
+import contextlib
+import copy
+import io
+import random
+import re
 import sys
 import os
+import tempfile
+from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import CONFIG
-from core import OctoBuddy
-from evolution_engine import get_evolution_summary
+from octo import core, storage
+from octo.config import CONFIG
+from octo.core import OctoBuddy, STATE_FLUSH_INTERVAL
+from octo.evolution_engine import get_evolution_summary
+from octo.mutation_rules import MUTATION_POOL
+from octo.storage import DEFAULT_STATE
 
 def main():
     print("=" * 60)
@@ -96,6 +106,116 @@ def main():
     print("\n" + "=" * 60)
     print("Note: Run this multiple times to see different mutations!")
     print("=" * 60)
+    
+    test_state_flush_coalescing()
+    test_events_batch_matches_single_events()
+
+
+def test_state_flush_coalescing():
+    """Events inside STATE_FLUSH_INTERVAL share one save; flush() writes them."""
+    print("\n" + "=" * 60)
+    print("STATE FLUSH COALESCING")
+    print("=" * 60)
+    
+    saves = []
+    original_save_state = core.save_state
+    original_render = core.render
+    original_state_file = storage.STATE_FILE
+    
+    def counting_save_state(state):
+        saves.append(state.get("study_events", 0))
+        original_save_state(state)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        storage.STATE_FILE = Path(tmp) / "octo_state.json"
+        core.save_state = counting_save_state
+        # Terminal rendering animates with sleeps; keep events well inside the interval
+        core.render = lambda *args: None
+        buddy = OctoBuddy(CONFIG)
+        try:
+            for _ in range(5):
+                buddy.handle_event("studied_python")
+            assert saves == [], f"expected no saves inside {STATE_FLUSH_INTERVAL}s, got {len(saves)}"
+            
+            buddy.flush()
+            assert len(saves) == 1, f"expected one coalesced save, got {len(saves)}"
+            written = storage.load_state()
+            assert written["study_events"] == buddy.state["study_events"]
+            
+            # Nothing pending: flushing again does not write
+            buddy.flush()
+            assert len(saves) == 1
+            
+            # Once the interval has passed, the next event flushes by itself
+            buddy._last_flush -= STATE_FLUSH_INTERVAL + 1
+            buddy.handle_event("studied_python")
+            assert len(saves) == 2
+        finally:
+            buddy.shutdown()
+            core.save_state = original_save_state
+            core.render = original_render
+            storage.STATE_FILE = original_state_file
+    
+    print(f"\n✅ 5 events -> {len(saves) - 1} save after flush()")
+
+
+def test_events_batch_matches_single_events():
+    """handle_events_batch ends in the same state and announcements as single events."""
+    print("\n" + "=" * 60)
+    print("BATCHED EVENTS MATCH SINGLE EVENTS")
+    print("=" * 60)
+    
+    # Every mutation already acquired, so the per-event mutation rolls can't
+    # change state (single events make extra mood/phrase rolls a batch skips).
+    # One activity short of ascension, so the first event announces it.
+    start_state = {
+        **copy.deepcopy(DEFAULT_STATE),
+        "study_events": 499,
+        "mutations": list(MUTATION_POOL),
+    }
+    
+    def run(apply_events):
+        buddy = OctoBuddy(CONFIG)
+        buddy.state = {**copy.deepcopy(start_state), "config": CONFIG}
+        random.seed(1234)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            apply_events(buddy)
+        buddy.shutdown()
+        
+        # Each announcement is printed once per animation frame, in the mood's
+        # color; keep the text, once per render
+        announcements = []
+        for match in re.finditer(r"(?:MUTATION ACQUIRED|EVOLUTION TRIGGER): [^!]*!", output.getvalue()):
+            if not announcements or announcements[-1] != match.group():
+                announcements.append(match.group())
+        final_state = {k: v for k, v in buddy.state.items() if k != "config"}
+        return final_state, announcements
+    
+    def single(buddy):
+        for _ in range(5):
+            buddy.handle_event("studied_python")
+    
+    def batch(buddy):
+        buddy.handle_events_batch("studied_python", 5)
+    
+    original_state_file = storage.STATE_FILE
+    with tempfile.TemporaryDirectory() as tmp:
+        storage.STATE_FILE = Path(tmp) / "octo_state.json"
+        try:
+            single_state, single_announcements = run(single)
+            batch_state, batch_announcements = run(batch)
+        finally:
+            storage.STATE_FILE = original_state_file
+    
+    assert batch_state == single_state, "batched events ended in a different state"
+    assert batch_announcements == single_announcements
+    assert any("ASCENSION" in line for line in batch_announcements)
+    
+    print(f"\n✅ Same final state and {len(batch_announcements)} announcement(s):")
+    for line in batch_announcements:
+        print(f"  {line}")
+
 
 if __name__ == "__main__":
     main()
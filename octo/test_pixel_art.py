@@ -10,13 +10,22 @@ Demonstrates:
 
 import sys
 import os
+import tempfile
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import CONFIG
-from pixel_art import render_pixel_art, save_pixel_art_ppm, pixel_art_to_ascii
-from storage import DEFAULT_STATE
+from octo.config import CONFIG
+from octo.pixel_art import (
+    CANVAS_SIZE,
+    render_pixel_art,
+    render_signature,
+    save_pixel_art_ppm,
+    pixel_art_to_ascii,
+)
+from octo.storage import DEFAULT_STATE
 
 
 def test_basic_render():
@@ -173,6 +182,94 @@ def test_personality_drift_colors():
         print(pixel_art_to_ascii(grid, width=40))
 
 
+def test_render_into_buffer():
+    """Test rendering into a caller-supplied buffer."""
+    print("=" * 70)
+    print("TEST 7: Render Into Reused Buffer")
+    print("=" * 70)
+    
+    states = [
+        {**DEFAULT_STATE, "config": CONFIG},
+        {
+            **DEFAULT_STATE,
+            "xp": 500000,
+            "mutations": ["transcendent", "analytical_mind", "unstoppable"],
+            "config": CONFIG,
+        },
+    ]
+    
+    buffer = np.zeros((CANVAS_SIZE, CANVAS_SIZE, 3), dtype=np.uint8)
+    for state in states:
+        # Stage and mood passed explicitly: get_mood can roll a random mood swing
+        expected = render_pixel_art(state, CONFIG, "Analyst", "proud")
+        result = render_pixel_art(state, CONFIG, "Analyst", "proud", out=buffer)
+        
+        assert result is buffer, "render_pixel_art(out=...) should return the supplied buffer"
+        assert np.array_equal(buffer, expected), "buffer differs from the allocating render"
+        print(f"\n✅ {len(state['mutations'])} mutations: buffer matches allocating render")
+    print()
+
+
+def test_render_signature():
+    """Test that the render signature tracks every visual input."""
+    print("=" * 70)
+    print("TEST 8: Render Signature")
+    print("=" * 70)
+    
+    state = {**DEFAULT_STATE, "mutations": ["night_owl"], "config": CONFIG}
+    base = render_signature(state, "Learner", "curious")
+    
+    assert render_signature(dict(state), "Learner", "curious") == base
+    assert render_signature(state, "Analyst", "curious") != base, "stage change not in signature"
+    assert render_signature(state, "Learner", "proud") != base, "mood change not in signature"
+    mutated = {**state, "mutations": ["night_owl", "analytical_mind"]}
+    assert render_signature(mutated, "Learner", "curious") != base, "mutations not in signature"
+    drifted = {**state, "personality_drift": {"analytical": 0.1, "chaotic": 0.7, "studious": 0.1, "ambitious": 0.1}}
+    assert render_signature(drifted, "Learner", "curious") != base, "dominant drift not in signature"
+    reseeded = {**state, "xp": state.get("xp", 0) + 1}
+    assert render_signature(reseeded, "Learner", "curious") != base, "sparkle seed not in signature"
+    
+    print("\n✅ Signature changes with stage, mood, mutations, dominant drift and sparkle seed")
+    print()
+
+
+def test_ppm_round_trip():
+    """Test that binary and ASCII PPM files read back to the same pixels."""
+    print("=" * 70)
+    print("TEST 9: PPM Round Trip (P6 and P3)")
+    print("=" * 70)
+    
+    state = {**DEFAULT_STATE, "mutations": ["night_owl"], "config": CONFIG}
+    grid = render_pixel_art(state, CONFIG, "Learner", "curious")
+    height, width = grid.shape[:2]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        binary_path = os.path.join(tmp, "binary.ppm")
+        save_pixel_art_ppm(grid, binary_path)  # Binary P6 is the default
+        with open(binary_path, "rb") as f:
+            data = f.read()
+        # P6: whitespace-separated header, one whitespace byte, then raw RGB bytes
+        pixel_count = width * height * 3
+        header, pixels = data[:-pixel_count], data[-pixel_count:]
+        assert header.split() == [b"P6", str(width).encode(), str(height).encode(), b"255"]
+        assert header[-1:].isspace(), "P6 header must end in a single whitespace byte"
+        parsed = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 3)
+        assert np.array_equal(parsed, grid), "P6 pixels differ from the grid"
+        print(f"\n✅ P6: {width}x{height}, {len(pixels)} pixel bytes match")
+        
+        ascii_path = os.path.join(tmp, "ascii.ppm")
+        save_pixel_art_ppm(grid, ascii_path, binary=False)
+        with open(ascii_path, "r") as f:
+            magic, *tokens = f.read().split()
+        assert magic == "P3"
+        assert tokens[:3] == [str(width), str(height), "255"]
+        values = np.array(tokens[3:], dtype=np.int64)
+        assert values.size == pixel_count, "P3 should hold one value per channel"
+        assert np.array_equal(values.reshape(grid.shape), grid), "P3 values differ from the grid"
+        print(f"✅ P3: {width}x{height}, {values.size} values match")
+    print()
+
+
 def main():
     print("\n" + "=" * 70)
     print("OCTOBUDDY PIXEL ART RENDERER TEST SUITE")
@@ -186,6 +283,9 @@ def main():
         test_mood_variations,
         test_personality_drift_colors,
         test_export_ppm,
+        test_render_into_buffer,
+        test_render_signature,
+        test_ppm_round_trip,
     ]
     
     for test in tests: